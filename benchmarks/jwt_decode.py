@@ -0,0 +1,42 @@
+"""Cold vs warm cost of decoding an access token.
+
+Run from the project root with the usual ``.env`` in place:
+
+    python -m benchmarks.jwt_decode
+"""
+
+import timeit
+
+from jose import jwt
+
+from src.backend.app.auth.cache import verified_token_cache
+from src.backend.app.auth.utils import create_access_token
+from src.backend.app.auth.utils import decode_access_token
+from src.backend.app.core.config import settings
+
+NUMBER = 2000
+
+
+def main() -> None:
+    token = create_access_token(
+        payload={"sub": "benchmark", "user_id": 1, "role": "USER", "is_active": True}
+    )
+    pem = settings.public_key_path.read_text()
+
+    cases = {
+        "PEM key, no cache": lambda: jwt.decode(
+            token, key=pem, algorithms=[settings.algorithm]
+        ),
+        "prepared key, no cache": lambda: decode_access_token(token, use_cache=False),
+        "prepared key, warm cache": lambda: decode_access_token(token),
+    }
+    verified_token_cache.clear()
+    decode_access_token(token)
+
+    for name, func in cases.items():
+        seconds = timeit.timeit(func, number=NUMBER)
+        print(f"{name:<26} {seconds / NUMBER * 1e6:10.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
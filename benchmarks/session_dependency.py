@@ -0,0 +1,85 @@
+"""Per-request cost of the session dependencies.
+
+``legacy scoped`` is the dependency as it was before: a new
+``async_scoped_session`` registry per request and ``close()`` only when
+the handler returns normally. Each case is driven the way FastAPI
+drives a yield dependency. The error-path run executes ``SELECT 1`` and
+then raises, and reports how many connections are still checked out.
+
+Run from the project root with the usual ``.env`` in place:
+
+    python -m benchmarks.session_dependency
+"""
+
+import asyncio
+import contextlib
+import time
+
+from sqlalchemy import text
+
+from src.backend.app.core.models import db_helper
+
+NUMBER = 5000
+# stay below pool_size + max_overflow, leaked connections block new checkouts
+ERROR_NUMBER = 10
+
+
+async def legacy_scoped_session_dependency():
+    session = db_helper.get_scoped_session()
+    yield session
+    await session.close()
+
+
+CASES = {
+    "legacy scoped": legacy_scoped_session_dependency,
+    "scoped": db_helper.scoped_session_dependency,
+    "plain": db_helper.session_dependency,
+}
+
+
+async def overhead(dependency) -> float:
+    request = contextlib.asynccontextmanager(dependency)
+    started = time.perf_counter()
+    for _ in range(NUMBER):
+        async with request():
+            pass
+    return (time.perf_counter() - started) / NUMBER
+
+
+async def error_path(dependency) -> int:
+    """Connections left checked out after ``ERROR_NUMBER`` failing requests"""
+    request = contextlib.asynccontextmanager(dependency)
+    before = db_helper.engine.pool.checkedout()
+    sessions = []
+    for _ in range(ERROR_NUMBER):
+        with contextlib.suppress(RuntimeError):
+            async with request() as session:
+                # keep a reference so leaked connections are not
+                # reclaimed by the garbage collector mid-run
+                sessions.append(session)
+                await session.execute(text("SELECT 1"))
+                raise RuntimeError
+    leaked = db_helper.engine.pool.checkedout() - before
+    for session in sessions:
+        await session.close()
+    return leaked
+
+
+async def main() -> None:
+    for name, dependency in CASES.items():
+        seconds = await overhead(dependency)
+        print(f"{name:<14} {seconds * 1e6:8.1f} us/request")
+
+    print(f"\nconnections left checked out after {ERROR_NUMBER} failing requests:")
+    for name, dependency in CASES.items():
+        try:
+            checked_out = await error_path(dependency)
+        except Exception as e:
+            print(f"{name:<14} skipped, database unavailable: {e}")
+            break
+        print(f"{name:<14} {checked_out:3d}")
+    await db_helper.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
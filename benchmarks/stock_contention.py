@@ -0,0 +1,128 @@
+"""Concurrent buyers of one hot product, naive vs conditional UPDATE.
+
+Seeds a product with ``STOCK`` units, then starts ``TASKS`` concurrent
+tasks that each buy one unit in their own transaction. ``read-modify-write``
+loads the product, checks and decrements ``quantity`` in Python and
+commits, the way ``update_product`` used to. ``reserve_stock`` is the
+single conditional ``UPDATE``. Reports how many units were sold (more
+than ``STOCK`` means an oversell), the final quantity, throughput and
+latency. The seeded rows are deleted at the end.
+
+Run from the project root with the usual ``.env`` in place:
+
+    python -m benchmarks.stock_contention
+"""
+
+import asyncio
+import statistics
+import time
+
+from fastapi import HTTPException
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import update
+from sqlmodel import select
+
+from src.backend.app.core.models import Category
+from src.backend.app.core.models import db_helper
+from src.backend.app.core.models import Product
+from src.backend.app.products.crud import reserve_stock
+
+STOCK = 100
+TASKS = 500
+
+
+async def read_modify_write(session, product_id: int) -> bool:
+    product = await session.get(Product, product_id)
+    if product.quantity < 1:
+        return False
+    product.quantity -= 1
+    product.available = product.quantity > 0
+    await session.commit()
+    return True
+
+
+async def conditional_update(session, product_id: int) -> bool:
+    try:
+        await reserve_stock(session, {product_id: 1})
+    except HTTPException:
+        await session.rollback()
+        return False
+    await session.commit()
+    return True
+
+
+CASES = {
+    "read-modify-write": read_modify_write,
+    "reserve_stock": conditional_update,
+}
+
+
+async def buy(buy_one, product_id: int, latencies: list[float]) -> bool:
+    started = time.perf_counter()
+    async with db_helper.session_factory() as session:
+        sold = await buy_one(session, product_id)
+    latencies.append(time.perf_counter() - started)
+    return sold
+
+
+async def run(buy_one, product_id: int) -> None:
+    async with db_helper.session_factory() as session:
+        await session.execute(
+            update(Product)
+            .where(Product.id == product_id)
+            .values(quantity=STOCK, available=True)
+        )
+        await session.commit()
+
+    latencies = []
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(buy(buy_one, product_id, latencies) for _ in range(TASKS))
+    )
+    elapsed = time.perf_counter() - started
+
+    async with db_helper.session_factory() as session:
+        quantity = await session.scalar(
+            select(Product.quantity).where(Product.id == product_id)
+        )
+    latencies.sort()
+    print(
+        f"sold {sum(results):4d}/{STOCK} final quantity {quantity:4d}"
+        f" {TASKS / elapsed:8.0f} tasks/s"
+        f" p50 {statistics.median(latencies) * 1e3:6.1f} ms"
+        f" p99 {latencies[int(len(latencies) * 0.99)] * 1e3:6.1f} ms"
+    )
+
+
+async def main() -> None:
+    async with db_helper.session_factory() as session:
+        category_id = await session.scalar(
+            insert(Category).values(name="benchmark").returning(Category.id)
+        )
+        product_id = await session.scalar(
+            insert(Product)
+            .values(
+                name="hot product",
+                description="benchmark",
+                price=1,
+                quantity=STOCK,
+                category_id=category_id,
+            )
+            .returning(Product.id)
+        )
+        await session.commit()
+    try:
+        for name, buy_one in CASES.items():
+            print(f"{name:<18}", end=" ", flush=True)
+            await run(buy_one, product_id)
+    finally:
+        async with db_helper.session_factory() as session:
+            await session.execute(delete(Product).where(Product.id == product_id))
+            await session.execute(delete(Category).where(Category.id == category_id))
+            await session.commit()
+        await db_helper.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
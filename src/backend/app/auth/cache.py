@@ -0,0 +1,110 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+from src.backend.app.auth.schemas import UserAuthSchema
+from src.backend.app.core.config import settings
+
+
+class UserCache:
+    """LRU cache with a TTL for the user data used by role checks.
+
+    The cache is local to the worker process: explicit invalidation only
+    reaches the current worker, other workers catch up once the TTL expires.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, UserAuthSchema]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, username: str) -> UserAuthSchema | None:
+        entry = self._entries.get(username)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[username]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(username)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, username: str, user: UserAuthSchema) -> None:
+        self._entries[username] = (time.monotonic() + self.ttl_seconds, user)
+        self._entries.move_to_end(username)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *usernames: str) -> None:
+        for username in usernames:
+            self._entries.pop(username, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class VerifiedTokenCache:
+    """LRU of already verified tokens mapped to their claims.
+
+    Tokens are keyed by their SHA-256 digest and kept until their ``exp``,
+    so repeated requests with the same cookie skip the signature check.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, digest: bytes) -> dict | None:
+        entry = self._entries.get(digest)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[digest]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return dict(entry[1])
+
+    def set(self, digest: bytes, claims: dict) -> None:
+        expires_at = claims.get("exp")
+        if expires_at is None:
+            return
+        self._entries[digest] = (float(expires_at), dict(claims))
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+user_cache = UserCache(
+    ttl_seconds=settings.user_cache_ttl_seconds,
+    max_size=settings.user_cache_max_size,
+)
+verified_token_cache = VerifiedTokenCache(max_size=settings.token_cache_max_size)
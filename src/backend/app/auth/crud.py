@@ -0,0 +1,73 @@
+from datetime import datetime
+from datetime import timedelta
+
+from fastapi import HTTPException
+from fastapi import status
+from sqlalchemy import delete
+from sqlalchemy import update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.backend.app.auth.utils import generate_refresh_token
+from src.backend.app.auth.utils import hash_refresh_token
+from src.backend.app.core.config import settings
+from src.backend.app.core.models import RefreshToken
+from src.backend.app.core.models import User
+
+
+async def create_refresh_token(session: AsyncSession, user_id: int) -> str:
+    """Create refresh token for the user"""
+    token = generate_refresh_token()
+    now = datetime.utcnow()
+    try:
+        await session.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.user_id == user_id)
+            .where(RefreshToken.expires_at <= now)
+        )
+        session.add(
+            RefreshToken(
+                user_id=user_id,
+                token_hash=hash_refresh_token(token),
+                expires_at=now + timedelta(days=settings.refresh_token_expire_days),
+            )
+        )
+        await session.flush()
+        return token
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+        )
+
+
+async def rotate_refresh_token(session: AsyncSession, token: str) -> tuple[Row, str]:
+    """Replace a valid refresh token with a new one in a single statement"""
+    new_token = generate_refresh_token()
+    now = datetime.utcnow()
+    statement = (
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(token))
+        .where(RefreshToken.expires_at > now)
+        .where(RefreshToken.user_id == User.id)
+        .where(User.is_active == True)
+        .values(
+            token_hash=hash_refresh_token(new_token),
+            expires_at=now + timedelta(days=settings.refresh_token_expire_days),
+        )
+        .returning(User.id, User.username, User.email, User.role, User.is_active)
+    )
+    try:
+        result = await session.execute(statement)
+        user = result.one_or_none()
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+        )
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user, new_token
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from src.backend.app.core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def hash_password(password: str) -> str:
+    """Hash the password (blocking)"""
+    return pwd_context.hash(password)
+
+
+def check_password(password: str, hashed_password: str) -> bool:
+    """Password verification (blocking)"""
+    return pwd_context.verify(password, hashed_password)
+
+
+class PasswordHasher:
+    """Runs bcrypt in a worker pool so it never blocks the event loop.
+
+    At most ``max_concurrency`` calls are handed to the pool at once,
+    the rest wait on a semaphore and are reported as the queue depth.
+    """
+
+    def __init__(self, executor: str, workers: int, max_concurrency: int):
+        self.executor_type = executor
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self._executor: Executor | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.waiting = 0
+        self.running = 0
+        self.max_waiting = 0
+        self.completed = 0
+        self.total_wait_seconds = 0.0
+
+    def get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    async def _run(self, func, *args):
+        started = time.perf_counter()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.total_wait_seconds += time.perf_counter() - started
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.get_executor(), func, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(check_password, password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "executor": self.executor_type,
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "waiting": self.waiting,
+            "running": self.running,
+            "max_waiting": self.max_waiting,
+            "completed": self.completed,
+            "avg_wait_seconds": (
+                self.total_wait_seconds / self.completed if self.completed else 0.0
+            ),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor=settings.password_hash_executor,
+    workers=settings.password_hash_workers,
+    max_concurrency=settings.password_hash_max_concurrency,
+)
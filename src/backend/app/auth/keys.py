@@ -0,0 +1,128 @@
+import asyncio
+import contextlib
+import hashlib
+import logging
+import signal
+from pathlib import Path
+
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+from src.backend.app.auth.cache import verified_token_cache
+from src.backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_kid(key: Key) -> str:
+    """Key id derived from the public part of the key"""
+    public_key = key if key.is_public() else key.public_key()
+    return hashlib.sha256(public_key.to_pem()).hexdigest()[:16]
+
+
+class KeyRing:
+    """Parsed signing and verification keys indexed by ``kid``.
+
+    Tokens are signed with the key at ``private_key_path``. They are
+    verified against its public key and every ``*.pem`` public key found
+    in ``previous_keys_dir``, so tokens signed before a rotation stay
+    valid. Files are only re-read when their modification time changes.
+    """
+
+    def __init__(
+        self,
+        private_key_path: Path,
+        public_key_path: Path,
+        previous_keys_dir: Path,
+        algorithm: str,
+    ):
+        self.private_key_path = private_key_path
+        self.public_key_path = public_key_path
+        self.previous_keys_dir = previous_keys_dir
+        self.algorithm = algorithm
+        self.active_kid: str | None = None
+        self.signing_key: Key | None = None
+        self.verification_keys: dict[str, Key] = {}
+        self._parsed: dict[Path, tuple[float, Key]] = {}
+        self._reload_task: asyncio.Task | None = None
+
+    def _parse(self, path: Path) -> Key:
+        mtime = path.stat().st_mtime
+        parsed = self._parsed.get(path)
+        if parsed is None or parsed[0] != mtime:
+            parsed = (mtime, jwk.construct(path.read_text(), self.algorithm))
+            self._parsed[path] = parsed
+        return parsed[1]
+
+    def load(self) -> bool:
+        """(Re)load keys from disk, return True if anything changed"""
+        paths = [self.public_key_path]
+        if self.previous_keys_dir.is_dir():
+            paths.extend(sorted(self.previous_keys_dir.glob("*.pem")))
+        signing_key = self._parse(self.private_key_path)
+        verification_keys = {}
+        for path in paths:
+            key = self._parse(path)
+            verification_keys[get_kid(key)] = key
+        self._parsed = {
+            path: parsed
+            for path, parsed in self._parsed.items()
+            if path in paths or path == self.private_key_path
+        }
+        active_kid = get_kid(signing_key)
+        if active_kid not in verification_keys:
+            verification_keys[active_kid] = signing_key.public_key()
+
+        changed = (
+            active_kid != self.active_kid
+            or verification_keys.keys() != self.verification_keys.keys()
+        )
+        self.signing_key = signing_key
+        self.active_kid = active_kid
+        self.verification_keys = verification_keys
+        if changed:
+            # tokens verified with a key that is gone must be checked again
+            verified_token_cache.clear()
+        return changed
+
+    def reload(self) -> None:
+        try:
+            if self.load():
+                logger.info("Key ring reloaded, active kid %s", self.active_kid)
+        except (OSError, JWKError) as e:
+            logger.error("Key ring reload failed, keeping current keys: %s", e)
+
+    def get_verification_key(self, kid: str | None) -> Key | None:
+        if kid is None:
+            kid = self.active_kid
+        return self.verification_keys.get(kid)
+
+    async def _reload_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.reload()
+
+    def start_auto_reload(self, interval: float) -> None:
+        """Reload on SIGHUP and, if ``interval`` is set, on a timer"""
+        loop = asyncio.get_running_loop()
+        with contextlib.suppress(NotImplementedError, RuntimeError):
+            loop.add_signal_handler(signal.SIGHUP, self.reload)
+        if interval > 0:
+            self._reload_task = loop.create_task(self._reload_periodically(interval))
+
+    def stop_auto_reload(self) -> None:
+        with contextlib.suppress(NotImplementedError, RuntimeError):
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            self._reload_task = None
+
+
+key_ring = KeyRing(
+    private_key_path=settings.private_key_path,
+    public_key_path=settings.public_key_path,
+    previous_keys_dir=settings.previous_public_keys_dir,
+    algorithm=settings.algorithm,
+)
+key_ring.load()
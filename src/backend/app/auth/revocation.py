@@ -0,0 +1,42 @@
+import time
+
+from src.backend.app.core.config import settings
+
+
+class TokenRevocationList:
+    """In-memory list of users whose earlier access tokens are no longer valid.
+
+    Revoking a user rejects every token issued to them up to that moment.
+    Entries are dropped once all such tokens would have expired anyway.
+
+    The list is local to the worker process and is not shared. Other
+    workers keep accepting the user's earlier access tokens, with their
+    old role claims, until those tokens expire, at most
+    ``access_token_expire_minutes`` later. Refreshed tokens are always
+    built from the database, so they carry the current role everywhere.
+    """
+
+    def __init__(self, token_lifetime_seconds: int):
+        self.token_lifetime_seconds = token_lifetime_seconds
+        self._revoked: dict[int, float] = {}
+
+    def revoke_user(self, user_id: int) -> None:
+        now = time.time()
+        self._revoked[user_id] = now
+        self.prune(now)
+
+    def is_revoked(self, user_id: int, issued_at: float | None) -> bool:
+        revoked_at = self._revoked.get(user_id)
+        if revoked_at is None:
+            return False
+        return issued_at is None or issued_at <= revoked_at
+
+    def prune(self, now: float | None = None) -> None:
+        oldest = (now or time.time()) - self.token_lifetime_seconds
+        for user_id in [k for k, v in self._revoked.items() if v < oldest]:
+            del self._revoked[user_id]
+
+
+token_revocation_list = TokenRevocationList(
+    token_lifetime_seconds=settings.access_token_expire_minutes * 60
+)
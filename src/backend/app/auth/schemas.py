@@ -1,6 +1,27 @@
 from pydantic import BaseModel
+from pydantic import ConfigDict
+
+from src.backend.app.core.models.user import Role
 
 
 class TokenDataSchema(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: str | None = None
+
+
+class UserAuthSchema(BaseModel):
+    id: int
+    username: str
+    role: Role
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @property
+    def is_super_admin(self) -> bool:
+        return Role.SUPER_ADMIN == self.role
+
+    @property
+    def is_admin(self) -> bool:
+        return Role.ADMIN == self.role
@@ -1,3 +1,6 @@
+import hashlib
+import secrets
+import time
 from datetime import datetime
 from datetime import timedelta
 from typing import Annotated
@@ -12,16 +15,23 @@ from fastapi.security import OAuth2
 from fastapi.security.utils import get_authorization_scheme_param
 from jose import jwt
 from jose import JWTError
-from passlib.context import CryptContext
+from jose.backends.base import Key
+from pydantic import ValidationError
+from sqlalchemy.engine import Result
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from src.backend.app.auth.cache import user_cache
+from src.backend.app.auth.cache import verified_token_cache
+from src.backend.app.auth.hashing import password_hasher
+from src.backend.app.auth.keys import key_ring
+from src.backend.app.auth.revocation import token_revocation_list
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.core.config import settings
+from src.backend.app.core.models import db_helper
 from src.backend.app.core.models import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class OAuth2PasswordBearerWithCookie(OAuth2):
     def __init__(
@@ -55,20 +65,32 @@ class OAuth2PasswordBearerWithCookie(OAuth2):
 oauth2_scheme = OAuth2PasswordBearerWithCookie(tokenUrl="/auth/login")
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """Hash the password"""
-    return pwd_context.hash(password)
+    return await password_hasher.hash(password)
 
 
-def verify_password(password: str, hashed_password: str) -> bool:
+async def verify_password(password: str, hashed_password: str) -> bool:
     """Password verification"""
-    return pwd_context.verify(password, hashed_password)
+    return await password_hasher.verify(password, hashed_password)
+
+
+def get_access_token_payload(user) -> dict:
+    """Claims of the access token for the user"""
+    return {
+        "sub": user.username,
+        "username": user.username,
+        "email": user.email,
+        "user_id": user.id,
+        "role": user.role,
+        "is_active": user.is_active,
+    }
 
 
 def create_access_token(
     payload: dict,
     algorithm: str = settings.algorithm,
-    private_key: str = settings.private_key_path.read_text(),
+    private_key: Key | None = None,
     expires_timedelta: timedelta | None = None,
     expire_minutes: int = settings.access_token_expire_minutes,
 ) -> str:
@@ -79,18 +101,54 @@ def create_access_token(
         expire = now + expires_timedelta
     else:
         expire = now + timedelta(minutes=expire_minutes)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(claims=to_encode, key=private_key, algorithm=algorithm)
+    to_encode.update({"exp": expire, "iat": time.time()})
+    headers = None
+    if private_key is None:
+        private_key = key_ring.signing_key
+        headers = {"kid": key_ring.active_kid}
+    encoded_jwt = jwt.encode(
+        claims=to_encode, key=private_key, algorithm=algorithm, headers=headers
+    )
     return encoded_jwt
 
 
+def generate_refresh_token() -> str:
+    """Generate opaque refresh token"""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> bytes:
+    """Digest under which the refresh token is stored"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_token_key(token: str) -> Key:
+    """Get the verification key named by the token's kid header"""
+    kid = jwt.get_unverified_header(token).get("kid")
+    public_key = key_ring.get_verification_key(kid)
+    if public_key is None:
+        raise JWTError(f"Unknown signing key {kid}")
+    return public_key
+
+
 def decode_access_token(
     token: str,
-    public_key: str = settings.public_key_path.read_text(),
+    public_key: Key | None = None,
     algorithm: str = settings.algorithm,
+    use_cache: bool = True,
 ) -> dict:
     """Decode token"""
-    decoded = jwt.decode(token=token, key=public_key, algorithms=[algorithm])
+    if public_key is not None:
+        return jwt.decode(token=token, key=public_key, algorithms=[algorithm])
+    if not use_cache:
+        return jwt.decode(token=token, key=get_token_key(token), algorithms=[algorithm])
+    digest = verified_token_cache.digest(token)
+    decoded = verified_token_cache.get(digest)
+    if decoded is None:
+        decoded = jwt.decode(
+            token=token, key=get_token_key(token), algorithms=[algorithm]
+        )
+        verified_token_cache.set(digest, decoded)
     return decoded
 
 
@@ -121,7 +179,12 @@ async def authenticate_user(
     user = await get_user_by_username(session=session, username=username)
     if not user:
         raise unauthed_exc
-    if not verify_password(password=password, hashed_password=user.hashed_password):
+    # end the read transaction so the connection goes back to the pool
+    # while bcrypt runs
+    await session.commit()
+    if not await verify_password(
+        password=password, hashed_password=user.hashed_password
+    ):
         raise unauthed_exc
     if not user.is_active:
         raise HTTPException(
@@ -130,10 +193,32 @@ async def authenticate_user(
     return user
 
 
-async def get_current_user_name(
+async def get_user_auth(session: AsyncSession, username: str) -> UserAuthSchema | None:
+    """Get the role and activity of the user, cached between requests"""
+    user_auth = user_cache.get(username)
+    if user_auth:
+        return user_auth
+    try:
+        statement = select(User.id, User.username, User.role, User.is_active).where(
+            User.username == username
+        )
+        result: Result = await session.execute(statement=statement)
+        row = result.one_or_none()
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+        )
+    if not row:
+        return None
+    user_auth = UserAuthSchema.model_validate(row)
+    user_cache.set(username, user_auth)
+    return user_auth
+
+
+async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-):
-    """Get current user name"""
+) -> UserAuthSchema:
+    """Get current user from the token claims"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -141,22 +226,34 @@ async def get_current_user_name(
     )
     try:
         payload: dict = decode_access_token(token=token)
-        username: str | None = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        return username
     except JWTError:
         raise credentials_exception
+    username: str | None = payload.get("sub")
+    if username is None:
+        raise credentials_exception
+    if "role" not in payload:
+        # tokens issued before role claims were added
+        async with db_helper.session_factory() as session:
+            current_user = await get_user_auth(session=session, username=username)
+        if current_user is None:
+            raise credentials_exception
+        return current_user
+    try:
+        current_user = UserAuthSchema(
+            id=payload.get("user_id"),
+            username=username,
+            role=payload.get("role"),
+            is_active=payload.get("is_active"),
+        )
+    except ValidationError:
+        raise credentials_exception
+    if token_revocation_list.is_revoked(current_user.id, payload.get("iat")):
+        raise credentials_exception
+    return current_user
 
 
-async def super_admin_required(
-    session: AsyncSession,
-    current_user_name: str = Depends(get_current_user_name),
-) -> User:
-    current_user: User | None = await get_user_by_username(
-        session=session, username=current_user_name
-    )
-    if not current_user or not current_user.is_super_admin:
+async def super_admin_required(current_user: UserAuthSchema) -> UserAuthSchema:
+    if not current_user.is_active or not current_user.is_super_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied: Super admin access required",
@@ -164,14 +261,8 @@ async def super_admin_required(
     return current_user
 
 
-async def admin_required(
-    session: AsyncSession,
-    current_user_name: str = Depends(get_current_user_name),
-) -> User:
-    current_user: User | None = await get_user_by_username(
-        session=session, username=current_user_name
-    )
-    if not current_user or (
+async def admin_required(current_user: UserAuthSchema) -> UserAuthSchema:
+    if not current_user.is_active or (
         not current_user.is_admin and not current_user.is_super_admin
     ):
         raise HTTPException(
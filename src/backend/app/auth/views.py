@@ -1,6 +1,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter
+from fastapi import Cookie
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Response
@@ -8,19 +9,34 @@ from fastapi import status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..core.config import settings
 from ..core.models import db_helper
+from .crud import create_refresh_token
+from .crud import rotate_refresh_token
 from .schemas import TokenDataSchema
 from .utils import authenticate_user
 from .utils import create_access_token
+from .utils import get_access_token_payload
 
 router = APIRouter(tags=["Auth"])
 
 
+def set_token_cookies(response: Response, token: str, refresh_token: str) -> None:
+    response.set_cookie(key="access_token", value=f"Bearer {token}", httponly=True)
+    response.set_cookie(
+        key="refresh_token",
+        value=refresh_token,
+        max_age=settings.refresh_token_expire_days * 24 * 60 * 60,
+        path="/auth",
+        httponly=True,
+    )
+
+
 @router.post("/login", response_model=TokenDataSchema)
 async def login_for_access_token(
     response: Response,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
     user = await authenticate_user(
         session=session, username=form_data.username, password=form_data.password
@@ -31,7 +47,31 @@ async def login_for_access_token(
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    payload = {"sub": user.username, "username": user.username, "email": user.email}
-    token = create_access_token(payload=payload)
-    response.set_cookie(key="access_token", value=f"Bearer {token}", httponly=True)
-    return TokenDataSchema(access_token=token, token_type="Bearer")
+    token = create_access_token(payload=get_access_token_payload(user))
+    refresh_token = await create_refresh_token(session=session, user_id=user.id)
+    set_token_cookies(response=response, token=token, refresh_token=refresh_token)
+    return TokenDataSchema(
+        access_token=token, token_type="Bearer", refresh_token=refresh_token
+    )
+
+
+@router.post("/refresh", response_model=TokenDataSchema)
+async def refresh_access_token(
+    response: Response,
+    refresh_token: Annotated[str | None, Cookie()] = None,
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+):
+    if not refresh_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    user, new_refresh_token = await rotate_refresh_token(
+        session=session, token=refresh_token
+    )
+    token = create_access_token(payload=get_access_token_payload(user))
+    set_token_cookies(response=response, token=token, refresh_token=new_refresh_token)
+    return TokenDataSchema(
+        access_token=token, token_type="Bearer", refresh_token=new_refresh_token
+    )
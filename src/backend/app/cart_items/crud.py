@@ -1,111 +1,74 @@
 from fastapi import HTTPException
 from fastapi import status
-from sqlalchemy.engine import Result
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.backend.app.cart_items.schemas import CartItemCreateSchema
 from src.backend.app.cart_items.schemas import CartItemUpdateSchema
 from src.backend.app.core.models import CartItem
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.repository import AsyncRepository
+from src.backend.app.core.repository import database_error
 
+cart_item_repository = AsyncRepository(CartItem, name="Cart_item")
 
-async def create_cart_item(
-    session: AsyncSession, cart_item: CartItemCreateSchema
-) -> CartItem:
-    """Create new cart_item"""
-    new_cart_item = CartItem(
-        cart_id=cart_item.cart_id,
-        product_id=cart_item.product_id,
-        quantity=cart_item.quantity,
-    )
-    try:
-        session.add(new_cart_item)
-        await session.commit()
-        await session.refresh(new_cart_item)
-        return new_cart_item
-    except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error",
-        )
+UNIQUE_VIOLATION = "23505"
 
 
-async def get_cart_item_by_id(
-    cart_item_id: int, session: AsyncSession
-) -> CartItem | None:
-    """Get cart_item by id"""
-    try:
-        statement = select(CartItem).where(CartItem.id == cart_item_id)
-        cart_item: CartItem | None = await session.scalar(statement=statement)
-        if not cart_item:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Cart_item {cart_item_id} not found",
-            )
-        return cart_item
-    except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+async def get_cart_items_by_cart_id(
+    cart_id: int, page: PageParams, session: AsyncSession
+) -> dict:
+    """Get cart_items by cart_id"""
+    return await cart_item_repository.get_page(
+        session, page, CartItem.cart_id == cart_id
+    )
 
 
-async def get_cart_items(session: AsyncSession) -> list[CartItem]:
-    """Get all cart_items"""
-    try:
-        statement = select(CartItem)
-        result: Result = await session.execute(statement=statement)
-        cart_items = result.scalars().all()
-        return list(cart_items)
-    except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+async def add_cart_item(session: AsyncSession, data: CartItemCreateSchema) -> CartItem:
+    """Add the product to the cart, or add to its quantity if already there"""
+    statement = insert(CartItem).values(**data.model_dump())
+    statement = (
+        statement.on_conflict_do_update(
+            index_elements=[CartItem.cart_id, CartItem.product_id],
+            set_={"quantity": CartItem.quantity + statement.excluded.quantity},
         )
-
-
-async def get_cart_items_by_cart_id(
-    cart_id: int, session: AsyncSession
-) -> list[CartItem]:
-    """Get cart_items by cart_id"""
+        .returning(CartItem)
+        .execution_options(populate_existing=True)
+    )
     try:
-        statement = select(CartItem).where(CartItem.cart_id == cart_id)
-        result: Result = await session.execute(statement=statement)
-        cart_items = result.scalars().all()
-        return list(cart_items)
+        return await session.scalar(statement)
     except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+        raise database_error()
 
 
 async def update_cart_item(
-    session: AsyncSession,
-    cart_item: CartItem,
-    cart_item_update: CartItemUpdateSchema,
+    session: AsyncSession, cart_item_id: int, data: CartItemUpdateSchema
 ) -> CartItem:
-    """Update cart_item"""
+    """Patch the line, 409 if the cart already has a line for that product"""
+    values = data.model_dump(exclude_unset=True)
+    if not values:
+        return await cart_item_repository.get(session=session, ident=cart_item_id)
+    statement = (
+        update(CartItem)
+        .where(CartItem.id == cart_item_id)
+        .values(**values)
+        .returning(CartItem)
+        .execution_options(populate_existing=True)
+    )
     try:
-        for name, value in cart_item_update.model_dump(exclude_unset=True).items():
-            setattr(cart_item, name, value)
-        await session.commit()
-        await session.refresh(cart_item)
-        return cart_item
-    except SQLAlchemyError:
-        await session.rollback()
+        cart_item = await session.scalar(statement)
+    except IntegrityError as e:
+        if getattr(e.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+            raise database_error()
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The cart already has a line for this product",
         )
-
-
-async def delete_cart_item(session: AsyncSession, cart_item: CartItem) -> None:
-    """Delete cart_item"""
-    try:
-        await session.delete(cart_item)
-        await session.commit()
-        return None
     except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+        raise database_error()
+    if cart_item is None:
+        raise cart_item_repository.not_found(cart_item_id)
+    return cart_item
@@ -1,68 +1,171 @@
 from fastapi import HTTPException
 from fastapi import status
-from sqlalchemy.engine import Result
+from sqlalchemy import all_
+from sqlalchemy import bindparam
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.backend.app.carts.schemas import CartCreateSchema
+from src.backend.app.carts.schemas import CartSyncMode
 from src.backend.app.core.models import Cart
+from src.backend.app.core.models import CartItem
+from src.backend.app.core.models import Product
+from src.backend.app.core.repository import AsyncRepository
+from src.backend.app.core.repository import database_error
 
+cart_repository = AsyncRepository(Cart)
 
-async def create_cart(session: AsyncSession, cart: CartCreateSchema) -> Cart:
-    """Create new cart"""
-    new_cart = Cart(user_id=cart.user_id)
-    try:
-        session.add(new_cart)
-        await session.commit()
-        await session.refresh(new_cart)
-        return new_cart
-    except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error",
-        )
+
+def stock_warning(line: dict) -> str | None:
+    if not line["available"]:
+        return f"{line['name']} is not available"
+    if line["stock"] < line["quantity"]:
+        return f"Only {line['stock']} of {line['name']} left"
+    return None
 
 
-async def get_carts(session: AsyncSession) -> list[Cart]:
-    """Get all carts"""
+async def get_cart_summary(session: AsyncSession, cart_id: int) -> dict:
+    """Get the cart lines with product details and totals, 404 if missing"""
+    statement = (
+        select(
+            Cart.user_id,
+            CartItem.product_id,
+            CartItem.quantity,
+            Product.name,
+            Product.price,
+            (Product.price * CartItem.quantity).label("line_total"),
+            Product.quantity.label("stock"),
+            Product.available,
+        )
+        .select_from(Cart)
+        .outerjoin(CartItem, CartItem.cart_id == Cart.id)
+        .outerjoin(Product, Product.id == CartItem.product_id)
+        .where(Cart.id == cart_id)
+        .order_by(CartItem.product_id)
+    )
     try:
-        statement = select(Cart)
-        result: Result = await session.execute(statement=statement)
-        carts = result.scalars().all()
-        return list(carts)
+        result = await session.execute(statement)
+        rows = result.mappings().all()
     except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+        raise database_error()
+    if not rows:
+        raise cart_repository.not_found(cart_id)
+    items = []
+    for row in rows:
+        if row["product_id"] is None:
+            continue
+        line = dict(row)
+        del line["user_id"]
+        line["warning"] = stock_warning(line)
+        items.append(line)
+    return {
+        "id": cart_id,
+        "user_id": rows[0]["user_id"],
+        "items": items,
+        "total_quantity": sum(line["quantity"] for line in items),
+        "total": sum(line["line_total"] for line in items),
+        "warnings": [line["warning"] for line in items if line["warning"]],
+    }
 
 
-async def get_cart_by_id(cart_id: int, session: AsyncSession) -> Cart | None:
-    """Get cart by id"""
+async def lock_carts(session: AsyncSession, *cart_ids: int) -> dict[int, int]:
+    """Lock the carts in id order and return their owners, 404 if missing"""
+    statement = (
+        select(Cart.id, Cart.user_id)
+        .where(Cart.id.in_(cart_ids))
+        .order_by(Cart.id)
+        .with_for_update()
+    )
     try:
-        statement = select(Cart).where(Cart.id == cart_id)
-        cart: Cart | None = await session.scalar(statement=statement)
-        if not cart:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Cart {cart_id} not found",
-            )
-        return cart
+        result = await session.execute(statement)
+        owners = dict(result.all())
     except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+        raise database_error()
+    for cart_id in cart_ids:
+        if cart_id not in owners:
+            raise cart_repository.not_found(cart_id)
+    return owners
 
 
-async def delete_cart(cart: Cart, session: AsyncSession) -> None:
-    """Delete cart"""
+async def sync_cart_items(
+    session: AsyncSession,
+    cart_id: int,
+    items: dict[int, int],
+    mode: CartSyncMode = CartSyncMode.REPLACE,
+    guest_cart_id: int | None = None,
+) -> None:
+    """Replace or merge the cart lines and fold in the guest cart"""
+    product_ids = list(items)
     try:
-        await session.delete(cart)
-        await session.commit()
-        return None
+        if items:
+            lines = (
+                func.unnest(
+                    bindparam("product_ids", product_ids, type_=ARRAY(Integer)),
+                    bindparam("quantities", list(items.values()), type_=ARRAY(Integer)),
+                )
+                .table_valued("product_id", "quantity")
+                .render_derived()
+            )
+            # the join drops unknown products instead of failing on the FK
+            upsert = insert(CartItem).from_select(
+                ["cart_id", "product_id", "quantity"],
+                select(literal(cart_id), lines.c.product_id, lines.c.quantity).join(
+                    Product, Product.id == lines.c.product_id
+                ),
+            )
+            if mode is CartSyncMode.REPLACE:
+                quantity = upsert.excluded.quantity
+            else:
+                quantity = CartItem.quantity + upsert.excluded.quantity
+            result = await session.execute(
+                upsert.on_conflict_do_update(
+                    index_elements=[CartItem.cart_id, CartItem.product_id],
+                    set_={"quantity": quantity},
+                ).returning(CartItem.product_id)
+            )
+            found = set(result.scalars())
+            missing = [
+                product_id for product_id in product_ids if product_id not in found
+            ]
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Products {', '.join(map(str, missing))} not found",
+                )
+        if mode is CartSyncMode.REPLACE:
+            await session.execute(
+                delete(CartItem).where(
+                    CartItem.cart_id == cart_id,
+                    CartItem.product_id
+                    != all_(
+                        bindparam("product_ids", product_ids, type_=ARRAY(Integer))
+                    ),
+                )
+            )
+        if guest_cart_id is not None:
+            guest_items = insert(CartItem).from_select(
+                ["cart_id", "product_id", "quantity"],
+                select(literal(cart_id), CartItem.product_id, CartItem.quantity).where(
+                    CartItem.cart_id == guest_cart_id
+                ),
+            )
+            await session.execute(
+                guest_items.on_conflict_do_update(
+                    index_elements=[CartItem.cart_id, CartItem.product_id],
+                    set_={
+                        "quantity": CartItem.quantity + guest_items.excluded.quantity
+                    },
+                )
+            )
+            await session.execute(
+                delete(CartItem).where(CartItem.cart_id == guest_cart_id)
+            )
+            await session.execute(delete(Cart).where(Cart.id == guest_cart_id))
     except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+        raise database_error()
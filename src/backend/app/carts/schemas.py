@@ -1,4 +1,9 @@
+from enum import Enum
+
 from pydantic import BaseModel
+from pydantic import Field
+
+from src.backend.app.core.config import settings
 
 
 class CartBaseSchema(BaseModel):
@@ -11,3 +16,39 @@ class CartCreateSchema(CartBaseSchema):
 
 class CartSchema(CartBaseSchema):
     id: int
+
+
+class CartLineSchema(BaseModel):
+    product_id: int
+    name: str
+    price: int
+    quantity: int
+    line_total: int
+    stock: int
+    available: bool
+    warning: str | None = None
+
+
+class CartSummarySchema(CartSchema):
+    items: list[CartLineSchema]
+    total_quantity: int
+    total: int
+    warnings: list[str]
+
+
+class CartSyncMode(str, Enum):
+    REPLACE = "replace"
+    MERGE = "merge"
+
+
+class CartSyncItemSchema(BaseModel):
+    product_id: int
+    quantity: int = Field(gt=0)
+
+
+class CartSyncSchema(BaseModel):
+    items: list[CartSyncItemSchema] = Field(
+        default=[], max_length=settings.batch_size_max
+    )
+    mode: CartSyncMode = CartSyncMode.REPLACE
+    guest_cart_id: int | None = None
@@ -3,12 +3,17 @@ from fastapi import Depends
 from fastapi import status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.auth.utils import admin_required
-from src.backend.app.auth.utils import get_current_user_name
+from src.backend.app.auth.utils import get_current_user
 from src.backend.app.carts import crud
 from src.backend.app.carts.schemas import CartCreateSchema
 from src.backend.app.carts.schemas import CartSchema
+from src.backend.app.carts.schemas import CartSummarySchema
+from src.backend.app.carts.schemas import CartSyncSchema
 from src.backend.app.core.models import db_helper
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import PageSchema
 
 router = APIRouter(tags=["Cart"])
 
@@ -20,37 +25,74 @@ router = APIRouter(tags=["Cart"])
 )
 async def create_cart(
     cart_in: CartCreateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    return await crud.create_cart(session=session, cart=cart_in)
+    return await crud.cart_repository.create(session=session, data=cart_in)
 
 
-@router.get("/", response_model=list[CartSchema])
+@router.get("/", response_model=PageSchema[CartSchema])
 async def get_carts(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.get_carts(session=session)
+    await admin_required(current_user=current_user)
+    return await crud.cart_repository.get_page(session=session, page=page)
 
 
 @router.get("/{cart_id}", response_model=CartSchema)
 async def get_cart(
     cart_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.get_cart_by_id(cart_id=cart_id, session=session)
+    await admin_required(current_user=current_user)
+    return await crud.cart_repository.get(session=session, ident=cart_id)
+
+
+@router.get("/{cart_id}/summary", response_model=CartSummarySchema)
+async def get_cart_summary(
+    cart_id: int,
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
+):
+    summary = await crud.get_cart_summary(session=session, cart_id=cart_id)
+    if summary["user_id"] != current_user.id:
+        await admin_required(current_user=current_user)
+    return summary
+
+
+@router.put("/{cart_id}/items", response_model=CartSummarySchema)
+async def sync_cart_items(
+    cart_id: int,
+    sync: CartSyncSchema,
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
+):
+    guest_cart_id = sync.guest_cart_id if sync.guest_cart_id != cart_id else None
+    cart_ids = [cart_id] if guest_cart_id is None else [cart_id, guest_cart_id]
+    owners = await crud.lock_carts(session, *cart_ids)
+    if any(user_id != current_user.id for user_id in owners.values()):
+        await admin_required(current_user=current_user)
+    items = {}
+    for item in sync.items:
+        items[item.product_id] = items.get(item.product_id, 0) + item.quantity
+    await crud.sync_cart_items(
+        session=session,
+        cart_id=cart_id,
+        items=items,
+        mode=sync.mode,
+        guest_cart_id=guest_cart_id,
+    )
+    return await crud.get_cart_summary(session=session, cart_id=cart_id)
 
 
 @router.delete("/{cart_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_cart(
     cart_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    cart = await crud.get_cart_by_id(cart_id=cart_id, session=session)
-    await crud.delete_cart(cart=cart, session=session)
+    await admin_required(current_user=current_user)
+    await crud.cart_repository.delete(session=session, ident=cart_id)
     return None
@@ -17,11 +17,9 @@ async def create_category(
     new_category = Category(name=category.name)
     try:
         session.add(new_category)
-        await session.commit()
-        await session.refresh(new_category)
+        await session.flush()
         return new_category
     except SQLAlchemyError:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Category with that name already exists!",
@@ -40,7 +38,6 @@ async def get_category_by_name(session: AsyncSession, name: str) -> Category | N
             )
         return category
     except SQLAlchemyError:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
@@ -68,11 +65,9 @@ async def update_category(
     try:
         for name, value in category_update.model_dump().items():
             setattr(category, name, value)
-        await session.commit()
-        await session.refresh(category)
+        await session.flush()
         return category
     except SQLAlchemyError:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
@@ -82,9 +77,8 @@ async def delete_category(session: AsyncSession, category: Category) -> None:
     """Delete category"""
     try:
         await session.delete(category)
-        await session.commit()
+        await session.flush()
     except SQLAlchemyError:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
@@ -12,13 +13,40 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASS: str
+    DB_REPLICA_HOSTS: list[str] = []
+
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = -1
+    db_pool_pre_ping: bool = False
+    replica_max_lag_seconds: float = 5
+    replica_check_seconds: float = 5
+    replica_sticky_seconds: int = 10
 
     SUPER_ADMIN_PASSWORD: str
 
     private_key_path: Path = BASE_DIR / "certs" / "private.pem"
     public_key_path: Path = BASE_DIR / "certs" / "public.pem"
+    previous_public_keys_dir: Path = BASE_DIR / "certs" / "previous"
+    key_reload_seconds: int = 0
     algorithm: str = "RS256"
     access_token_expire_minutes: int = 15
+    refresh_token_expire_days: int = 30
+
+    password_hash_executor: Literal["thread", "process"] = "thread"
+    password_hash_workers: int = 4
+    password_hash_max_concurrency: int = 8
+
+    user_cache_ttl_seconds: int = 30
+    user_cache_max_size: int = 1024
+    token_cache_max_size: int = 4096
+
+    page_size_default: int = 50
+    page_size_max: int = 200
+    stream_chunk_size: int = 1000
+    batch_size_max: int = 500
+    autocomplete_reload_seconds: int = 60
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -29,5 +57,17 @@ class Settings(BaseSettings):
             f"{self.DB_PORT}/{self.DB_NAME}"
         )
 
+    @property
+    def replica_database_urls(self) -> list[str]:
+        # entries are "host" or "host:port", a bare host uses DB_PORT
+        hosts = [
+            host if ":" in host else f"{host}:{self.DB_PORT}"
+            for host in self.DB_REPLICA_HOSTS
+        ]
+        return [
+            f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASS}@{host}/{self.DB_NAME}"
+            for host in hosts
+        ]
+
 
 settings = Settings()
@@ -0,0 +1,38 @@
+from http.cookies import SimpleCookie
+
+from src.backend.app.core.models.db_helper import PRIMARY_STICKY_COOKIE
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class PrimaryStickyMiddleware:
+    """Marks clients that just wrote so their next reads go to the primary.
+
+    Successful non-GET requests get a short-lived cookie which
+    ``DatabaseHelper.read_session_dependency`` honours, giving the client
+    read-your-writes consistency while replicas catch up.
+    """
+
+    def __init__(self, app, max_age: int):
+        self.app = app
+        cookie = SimpleCookie()
+        cookie[PRIMARY_STICKY_COOKIE] = "1"
+        cookie[PRIMARY_STICKY_COOKIE]["max-age"] = max_age
+        cookie[PRIMARY_STICKY_COOKIE]["path"] = "/"
+        cookie[PRIMARY_STICKY_COOKIE]["httponly"] = True
+        self.set_cookie = cookie.output(header="").strip().encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                message.setdefault("headers", [])
+                message["headers"] = [
+                    *message["headers"],
+                    (b"set-cookie", self.set_cookie),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -12,6 +12,7 @@ __all__ = (
     "OrderProduct",
     "Product",
     "Profile",
+    "RefreshToken",
     "Review",
     "User",
 )
@@ -27,5 +28,6 @@ from .order import Order
 from .order_product import OrderProduct
 from .product import Product
 from .profile import Profile
+from .refresh_token import RefreshToken
 from .review import Review
 from .user import User
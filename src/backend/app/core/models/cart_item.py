@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlmodel import Field
 from sqlmodel import Relationship
 
@@ -11,6 +12,18 @@ if TYPE_CHECKING:
 
 
 class CartItem(Base, table=True):
+    __table_args__ = (
+        # one line per product and cart, also covers the cart summary join
+        # without visiting the heap
+        Index(
+            "uq_cartitem_cart_id_product_id",
+            "cart_id",
+            "product_id",
+            unique=True,
+            postgresql_include=["quantity"],
+        ),
+    )
+
     cart_id: int = Field(foreign_key="cart.id")
     product_id: int = Field(foreign_key="product.id")
     quantity: int
@@ -1,19 +1,170 @@
+import asyncio
+import contextlib
+import itertools
+import logging
+import time
 from asyncio import current_task
 
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy import exc
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_scoped_session
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.backend.app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+PRIMARY_STICKY_COOKIE = "db_primary"
+
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "idle": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "timeout": self.timeout(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_seconds": (
+                self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+            ),
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
 
 class DatabaseHelper:
-    def __init__(self, url: str, echo: bool = False):
-        self.engine = create_async_engine(url=url, echo=echo)
-        self.session_factory = async_sessionmaker(
-            bind=self.engine, autoflush=False, autocommit=False, expire_on_commit=False
+    """Primary engine plus optional read replicas.
+
+    Reads that opt into ``read_session_dependency`` go to a healthy replica,
+    unless the client wrote something recently (``PRIMARY_STICKY_COOKIE``)
+    or every replica is down or lagging, in which case the primary is used.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        echo: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        replica_urls: list[str] | None = None,
+        replica_max_lag_seconds: float = 5,
+    ):
+        engine_options = dict(
+            echo=echo,
+            poolclass=TimedAsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
         )
+        self.engine = create_async_engine(url=url, **engine_options)
+        self.session_factory = self.create_session_factory(self.engine)
+        self.replica_engines: list[AsyncEngine] = [
+            create_async_engine(url=replica_url, **engine_options)
+            for replica_url in replica_urls or []
+        ]
+        self.replica_session_factories = [
+            self.create_session_factory(engine) for engine in self.replica_engines
+        ]
+        self.replica_max_lag_seconds = replica_max_lag_seconds
+        self.replica_healthy = [True] * len(self.replica_engines)
+        self._replica_cycle = itertools.cycle(range(len(self.replica_engines)))
+        self._monitor_task: asyncio.Task | None = None
+
+    @staticmethod
+    def create_session_factory(engine: AsyncEngine) -> async_sessionmaker:
+        return async_sessionmaker(
+            bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
+        )
+
+    def get_read_session_factory(self) -> async_sessionmaker:
+        for _ in self.replica_engines:
+            index = next(self._replica_cycle)
+            if self.replica_healthy[index]:
+                return self.replica_session_factories[index]
+        return self.session_factory
+
+    async def read_session_dependency(self, request: Request) -> AsyncSession:
+        if request.cookies.get(PRIMARY_STICKY_COOKIE):
+            session = self.session_factory()
+        else:
+            session = self.get_read_session_factory()()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    async def check_replica(self, engine: AsyncEngine) -> bool:
+        try:
+            async with engine.connect() as connection:
+                lag = await asyncio.wait_for(
+                    connection.scalar(REPLICA_LAG_QUERY),
+                    timeout=self.replica_max_lag_seconds,
+                )
+            return lag <= self.replica_max_lag_seconds
+        except (exc.SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
+            logger.warning("Replica %s is unavailable: %s", engine.url, e)
+            return False
+
+    async def monitor_replicas(self, interval: float) -> None:
+        while True:
+            self.replica_healthy = [
+                await self.check_replica(engine) for engine in self.replica_engines
+            ]
+            await asyncio.sleep(interval)
+
+    def start_replica_monitor(self, interval: float) -> None:
+        if self.replica_engines:
+            self._monitor_task = asyncio.get_running_loop().create_task(
+                self.monitor_replicas(interval)
+            )
+
+    async def stop_replica_monitor(self) -> None:
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor_task
+            self._monitor_task = None
 
     def get_scoped_session(self):
         session = async_scoped_session(
@@ -24,8 +175,63 @@ class DatabaseHelper:
 
     async def scoped_session_dependency(self) -> AsyncSession:
         session = self.get_scoped_session()
-        yield session
-        await session.close()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    async def session_dependency(self) -> AsyncSession:
+        session = self.session_factory()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    async def transaction_dependency(self) -> AsyncSession:
+        """Session for a request that runs as a single unit of work.
+
+        Crud functions only flush; the transaction is committed once the
+        handler returns and rolled back if it raises.
+        """
+        session = self.session_factory()
+        try:
+            yield session
+            await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    @staticmethod
+    def after_commit(session: AsyncSession, func, *args) -> None:
+        """Call ``func(*args)`` once the session's transaction has committed.
+
+        For side effects outside the database, such as cache invalidation,
+        that must not be seen before the change is, and not at all if the
+        transaction is rolled back.
+        """
+        event.listen(
+            session.sync_session, "after_commit", lambda _: func(*args), once=True
+        )
+
+    def pool_stats(self) -> dict:
+        return {
+            "primary": self.engine.pool.stats(),
+            "replicas": [
+                {**engine.pool.stats(), "healthy": healthy}
+                for engine, healthy in zip(self.replica_engines, self.replica_healthy)
+            ],
+        }
 
 
-db_helper = DatabaseHelper(url=settings.database_url)
+db_helper = DatabaseHelper(
+    url=settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    replica_urls=settings.replica_database_urls,
+    replica_max_lag_seconds=settings.replica_max_lag_seconds,
+)
@@ -1,5 +1,11 @@
+from typing import Any
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Column
+from sqlalchemy import Computed
+from sqlalchemy import Index
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field
 from sqlmodel import Relationship
 
@@ -12,13 +18,46 @@ if TYPE_CHECKING:
     from .order_product import OrderProduct
 
 
+SEARCH_CONFIG = "english"
+
+
 class Product(Base, table=True):
+    __table_args__ = (
+        Index("ix_product_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_product_category_id_price_id", "category_id", "price", "id"),
+        Index(
+            "ix_product_available_price_id",
+            "price",
+            "id",
+            postgresql_where=text("available"),
+        ),
+    )
+
     name: str = Field(index=True)
     description: str
     price: int = Field(index=True)
     quantity: int
     available: bool = Field(default=True)
     category_id: int = Field(foreign_key="category.id")
+    # running totals of the product's reviews, kept by reviews.crud
+    review_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_sum: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    one_star_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    two_star_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    three_star_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    four_star_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    five_star_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    search_vector: Any = Field(
+        default=None,
+        sa_column=Column(
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', name), 'A') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', description), 'B')",
+                persisted=True,
+            ),
+        ),
+    )
     category: "Category" = Relationship(back_populates="products")
     reviews: list["Review"] = Relationship(back_populates="product")
     cart_items: list["CartItem"] = Relationship(back_populates="product")
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlmodel import Field
+
+from .base import Base
+
+
+class RefreshToken(Base, table=True):
+    user_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("user.id", ondelete="CASCADE"),
+            nullable=False,
+            index=True,
+        )
+    )
+    token_hash: bytes = Field(unique=True, index=True)
+    expires_at: datetime
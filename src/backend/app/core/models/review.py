@@ -17,6 +17,10 @@ class Rating(str, Enum):
     FOUR = "FOUR"
     FIVE = "FIVE"
 
+    @property
+    def stars(self) -> int:
+        return list(Rating).index(self) + 1
+
 
 class Review(Base, table=True):
     product_id: int = Field(foreign_key="product.id")
@@ -0,0 +1,143 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from typing import Generic
+from typing import TypeVar
+
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import status
+from pydantic import BaseModel
+from sqlalchemy import and_
+from sqlalchemy import or_
+from sqlalchemy import tuple_
+from sqlalchemy.sql import operators
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.elements import UnaryExpression
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.backend.app.core.config import settings
+
+ItemT = TypeVar("ItemT")
+
+
+class PageSchema(BaseModel, Generic[ItemT]):
+    items: list[ItemT]
+    next_cursor: str | None = None
+
+
+class PageParams:
+    """``limit`` and ``after`` query parameters of a list endpoint"""
+
+    def __init__(
+        self,
+        limit: int = Query(
+            default=settings.page_size_default, ge=1, le=settings.page_size_max
+        ),
+        after: str | None = Query(
+            default=None, description="next_cursor of the previous page"
+        ),
+    ):
+        self.limit = limit
+        self.after = after
+
+
+def encode_cursor(values: Sequence) -> str:
+    data = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key: Sequence[ColumnElement]) -> tuple:
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+    )
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+    except (binascii.Error, ValueError):
+        raise invalid_cursor
+    if not isinstance(values, list) or len(values) != len(key):
+        raise invalid_cursor
+    try:
+        return tuple(
+            column.type.python_type(value) for column, value in zip(key, values)
+        )
+    except (TypeError, ValueError, NotImplementedError):
+        raise invalid_cursor
+
+
+def split_key(
+    key: Sequence[ColumnElement],
+) -> tuple[list[ColumnElement], list[bool]]:
+    """Columns of a sort key and whether each one is descending"""
+    columns, descending = [], []
+    for element in key:
+        is_descending = (
+            isinstance(element, UnaryExpression)
+            and element.modifier is operators.desc_op
+        )
+        columns.append(element.element if is_descending else element)
+        descending.append(is_descending)
+    return columns, descending
+
+
+def after_cursor(
+    columns: list[ColumnElement], descending: list[bool], values: tuple
+) -> ColumnElement[bool]:
+    """Rows that sort after ``values``"""
+    if all(descending) or not any(descending):
+        if len(columns) == 1:
+            left, right = columns[0], values[0]
+        else:
+            # row comparison keeps it a single index range scan
+            left, right = tuple_(*columns), tuple_(*values)
+        return left < right if descending[0] else left > right
+    return or_(
+        *(
+            and_(
+                *(column == value for column, value in zip(columns[:i], values[:i])),
+                columns[i] < values[i] if descending[i] else columns[i] > values[i],
+            )
+            for i in range(len(columns))
+        )
+    )
+
+
+async def paginate(
+    session: AsyncSession,
+    statement: Select,
+    key: Sequence[ColumnElement],
+    page: PageParams,
+    mappings: bool = False,
+) -> dict:
+    """Run ``statement`` for one page, ordered by the unique ``key``.
+
+    ``key`` holds columns or labelled expressions of the statement, each
+    optionally wrapped in ``.desc()``. The cursor holds the key of the
+    last row, so the next page starts right after it in the index instead
+    of skipping ``OFFSET`` rows. Items are entities, or dicts when
+    ``mappings`` is set for a statement that selects columns.
+    """
+    columns, descending = split_key(key)
+    if page.after is not None:
+        values = decode_cursor(page.after, columns)
+        statement = statement.where(after_cursor(columns, descending, values))
+    statement = statement.order_by(*key).limit(page.limit + 1)
+    result = await session.execute(statement)
+    if mappings:
+        items = [dict(row) for row in result.mappings()]
+    else:
+        items = list(result.scalars().all())
+    next_cursor = None
+    if len(items) > page.limit:
+        items = items[: page.limit]
+        last = items[-1]
+        next_cursor = encode_cursor(
+            [
+                last[column.key] if mappings else getattr(last, column.key)
+                for column in columns
+            ]
+        )
+    return {"items": items, "next_cursor": next_cursor}
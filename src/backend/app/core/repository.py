@@ -0,0 +1,198 @@
+from collections.abc import Sequence
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from fastapi import HTTPException
+from fastapi import status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import and_
+from sqlalchemy import delete
+from sqlalchemy import inspect
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import select
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import paginate
+from src.backend.app.core.streaming import ndjson_response
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+def database_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+    )
+
+
+class AsyncRepository(Generic[ModelT]):
+    """Create/get/list/update/delete for one table model.
+
+    Every operation is a single statement: inserts are flushed as
+    ``INSERT ... RETURNING``, updates and deletes run as
+    ``UPDATE/DELETE ... RETURNING`` by primary key, so nothing is loaded
+    before a write and nothing is refreshed after it. Nothing is
+    committed here, that is left to ``db_helper.transaction_dependency``.
+
+    ``ident`` is the primary key value, or a tuple of values for
+    composite keys, in the order the key columns are declared.
+    """
+
+    def __init__(self, model: type[ModelT], name: str | None = None):
+        self.model = model
+        self.name = name or model.__name__
+        self.primary_key = tuple(
+            getattr(model, column.key) for column in inspect(model).primary_key
+        )
+
+    def where_ident(self, ident: Any) -> ColumnElement[bool]:
+        values = ident if isinstance(ident, tuple) else (ident,)
+        return and_(
+            *(column == value for column, value in zip(self.primary_key, values))
+        )
+
+    def not_found(self, ident: Any) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{self.name} {ident} not found",
+        )
+
+    @staticmethod
+    def _values(data: BaseModel | dict, exclude_unset: bool = False) -> dict:
+        if isinstance(data, BaseModel):
+            return data.model_dump(exclude_unset=exclude_unset)
+        return dict(data)
+
+    async def get(self, session: AsyncSession, ident: Any) -> ModelT:
+        """Get by primary key, 404 if missing"""
+        try:
+            instance = await session.get(self.model, ident)
+        except SQLAlchemyError:
+            raise database_error()
+        if instance is None:
+            raise self.not_found(ident)
+        return instance
+
+    async def get_all(
+        self, session: AsyncSession, *where: ColumnElement[bool]
+    ) -> list[ModelT]:
+        """Get all rows matching ``where``"""
+        try:
+            result = await session.scalars(select(self.model).where(*where))
+            return list(result.all())
+        except SQLAlchemyError:
+            raise database_error()
+
+    def columns(self, schema: type[BaseModel]) -> list[ColumnElement]:
+        """Model columns behind the fields of ``schema``, plus the primary key"""
+        table_columns = self.model.__table__.c.keys()
+        names = [name for name in schema.model_fields if name in table_columns]
+        names.extend(
+            column.key for column in self.primary_key if column.key not in names
+        )
+        return [getattr(self.model, name) for name in names]
+
+    async def get_page(
+        self,
+        session: AsyncSession,
+        page: PageParams,
+        *where: ColumnElement[bool],
+        schema: type[BaseModel] | None = None,
+    ) -> dict:
+        """Get one page of rows matching ``where`` in primary key order.
+
+        With ``schema`` only its columns are selected and the items are
+        plain dicts, no model instances or identity map entries are made.
+        """
+        if schema is None:
+            statement = select(self.model)
+        else:
+            statement = select(*self.columns(schema))
+        statement = statement.where(*where)
+        try:
+            return await paginate(
+                session, statement, self.primary_key, page, mappings=schema is not None
+            )
+        except SQLAlchemyError:
+            raise database_error()
+
+    def stream(
+        self, schema: type[BaseModel], *where: ColumnElement[bool]
+    ) -> StreamingResponse:
+        """NDJSON response with every row matching ``where``"""
+        statement = select(self.model).where(*where).order_by(*self.primary_key)
+        return ndjson_response(statement, schema)
+
+    async def create(self, session: AsyncSession, data: BaseModel | dict) -> ModelT:
+        """Insert one row"""
+        instance = self.model(**self._values(data))
+        try:
+            session.add(instance)
+            await session.flush()
+            return instance
+        except SQLAlchemyError:
+            raise database_error()
+
+    async def create_many(
+        self, session: AsyncSession, items: Sequence[BaseModel | dict]
+    ) -> list[ModelT]:
+        """Insert several rows, batched into one multi-row INSERT"""
+        instances = [self.model(**self._values(data)) for data in items]
+        try:
+            session.add_all(instances)
+            await session.flush()
+            return instances
+        except SQLAlchemyError:
+            raise database_error()
+
+    async def update(
+        self, session: AsyncSession, ident: Any, data: BaseModel | dict
+    ) -> ModelT:
+        """Patch one row with the fields that were set, 404 if missing"""
+        values = self._values(data, exclude_unset=True)
+        if not values:
+            return await self.get(session=session, ident=ident)
+        instances = await self.update_where(session, values, self.where_ident(ident))
+        if not instances:
+            raise self.not_found(ident)
+        return instances[0]
+
+    async def update_where(
+        self, session: AsyncSession, values: dict, *where: ColumnElement[bool]
+    ) -> list[ModelT]:
+        """Apply the same values to every row matching ``where``"""
+        statement = (
+            update(self.model)
+            .where(*where)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        try:
+            result = await session.scalars(statement)
+            return list(result.all())
+        except SQLAlchemyError:
+            raise database_error()
+
+    async def delete(self, session: AsyncSession, ident: Any) -> ModelT:
+        """Delete one row and return it, 404 if missing"""
+        instances = await self.delete_where(session, self.where_ident(ident))
+        if not instances:
+            raise self.not_found(ident)
+        return instances[0]
+
+    async def delete_where(
+        self, session: AsyncSession, *where: ColumnElement[bool]
+    ) -> list[ModelT]:
+        """Delete every row matching ``where`` and return them"""
+        statement = delete(self.model).where(*where).returning(self.model)
+        try:
+            result = await session.scalars(statement)
+            return list(result.all())
+        except SQLAlchemyError:
+            raise database_error()
@@ -0,0 +1,19 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic_core import to_jsonable_python
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, the app's default response class.
+
+    Values orjson has no native support for, schema objects included, are
+    converted by pydantic-core. Routes can opt out with
+    ``response_class=JSONResponse``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS
+        )
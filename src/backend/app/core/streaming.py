@@ -0,0 +1,45 @@
+from collections.abc import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.sql import Select
+
+from src.backend.app.core.config import settings
+from src.backend.app.core.models import db_helper
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_DESCRIPTION = "Return every row as NDJSON instead of one page"
+
+
+async def iter_ndjson(
+    statement: Select, schema: type[BaseModel], chunk_size: int
+) -> AsyncIterator[bytes]:
+    # the request's session is already closed once the body is being sent,
+    # so the stream holds its own session and server-side cursor
+    async with db_helper.session_factory() as session:
+        result = await session.stream_scalars(
+            statement.execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions():
+            yield b"".join(
+                schema.model_validate(row, from_attributes=True)
+                .model_dump_json()
+                .encode()
+                + b"\n"
+                for row in rows
+            )
+
+
+def ndjson_response(
+    statement: Select,
+    schema: type[BaseModel],
+    chunk_size: int = settings.stream_chunk_size,
+) -> StreamingResponse:
+    """Stream every row of ``statement`` as one JSON object per line.
+
+    Rows are fetched ``chunk_size`` at a time and written as soon as they
+    arrive, so memory use does not grow with the size of the table.
+    """
+    return StreamingResponse(
+        iter_ndjson(statement, schema, chunk_size), media_type=NDJSON_MEDIA_TYPE
+    )
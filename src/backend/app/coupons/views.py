@@ -3,9 +3,12 @@ from fastapi import Depends
 from fastapi import status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.auth.utils import admin_required
-from src.backend.app.auth.utils import get_current_user_name
+from src.backend.app.auth.utils import get_current_user
 from src.backend.app.core.models import db_helper
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import PageSchema
 from src.backend.app.coupons import crud
 from src.backend.app.coupons.schemas import CouponCreateSchema
 from src.backend.app.coupons.schemas import CouponSchema
@@ -21,32 +24,33 @@ router = APIRouter(tags=["Coupon"])
 )
 async def create_coupon(
     coupon_in: CouponCreateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.create_coupon(session=session, coupon=coupon_in)
+    await admin_required(current_user=current_user)
+    return await crud.coupon_repository.create(session=session, data=coupon_in)
 
 
-@router.get("/", response_model=list[CouponSchema])
+@router.get("/", response_model=PageSchema[CouponSchema])
 async def get_coupons(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
-    return await crud.get_coupons(session=session)
+    return await crud.coupon_repository.get_page(session=session, page=page)
 
 
 @router.get("/{coupon_id}", response_model=CouponSchema)
 async def get_coupon_by_id(
     coupon_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
-    return await crud.get_coupon_by_id(coupon_id=coupon_id, session=session)
+    return await crud.coupon_repository.get(session=session, ident=coupon_id)
 
 
 @router.get("/code/{coupon_code}", response_model=CouponSchema)
 async def get_coupon_by_code(
     coupon_code: str,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
     return await crud.get_coupon_by_code(coupon_code=coupon_code, session=session)
 
@@ -55,22 +59,20 @@ async def get_coupon_by_code(
 async def update_coupon(
     coupon_id: int,
     coupon_update: CouponUpdateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    coupon = await crud.get_coupon_by_id(coupon_id=coupon_id, session=session)
-    return await crud.update_coupon(
-        session=session, coupon=coupon, coupon_update=coupon_update
+    await admin_required(current_user=current_user)
+    return await crud.coupon_repository.update(
+        session=session, ident=coupon_id, data=coupon_update
     )
 
 
 @router.delete("/{coupon_id}", response_model=CouponSchema)
 async def delete_coupon(
     coupon_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    coupon = await crud.get_coupon_by_id(coupon_id=coupon_id, session=session)
-    return await crud.delete_coupon(session=session, coupon=coupon)
+    await admin_required(current_user=current_user)
+    return await crud.delete_coupon(coupon_id=coupon_id, session=session)
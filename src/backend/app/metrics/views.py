@@ -0,0 +1,44 @@
+from fastapi import APIRouter
+from fastapi import Depends
+
+from src.backend.app.auth.cache import user_cache
+from src.backend.app.auth.cache import verified_token_cache
+from src.backend.app.auth.hashing import password_hasher
+from src.backend.app.auth.schemas import UserAuthSchema
+from src.backend.app.auth.utils import admin_required
+from src.backend.app.auth.utils import get_current_user
+from src.backend.app.core.models import db_helper
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/password-hashing")
+async def get_password_hashing_stats(
+    current_user: UserAuthSchema = Depends(get_current_user),
+):
+    await admin_required(current_user=current_user)
+    return password_hasher.stats()
+
+
+@router.get("/user-cache")
+async def get_user_cache_stats(
+    current_user: UserAuthSchema = Depends(get_current_user),
+):
+    await admin_required(current_user=current_user)
+    return user_cache.stats()
+
+
+@router.get("/token-cache")
+async def get_token_cache_stats(
+    current_user: UserAuthSchema = Depends(get_current_user),
+):
+    await admin_required(current_user=current_user)
+    return verified_token_cache.stats()
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(
+    current_user: UserAuthSchema = Depends(get_current_user),
+):
+    await admin_required(current_user=current_user)
+    return db_helper.pool_stats()
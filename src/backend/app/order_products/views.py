@@ -3,9 +3,12 @@ from fastapi import Depends
 from fastapi import status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.auth.utils import admin_required
-from src.backend.app.auth.utils import get_current_user_name
+from src.backend.app.auth.utils import get_current_user
 from src.backend.app.core.models import db_helper
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import PageSchema
 from src.backend.app.order_products import crud
 from src.backend.app.order_products.schemas import OrderProductCreateSchema
 from src.backend.app.order_products.schemas import OrderProductSchema
@@ -21,30 +24,31 @@ router = APIRouter(tags=["Order Product"])
 )
 async def create_order_product(
     order_product_in: OrderProductCreateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    return await crud.create_order_product(
-        session=session, order_product=order_product_in
+    return await crud.order_product_repository.create(
+        session=session, data=order_product_in
     )
 
 
-@router.get("/", response_model=list[OrderProductSchema])
+@router.get("/", response_model=PageSchema[OrderProductSchema])
 async def get_order_products(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.get_order_products(session=session)
+    await admin_required(current_user=current_user)
+    return await crud.order_product_repository.get_page(session=session, page=page)
 
 
 @router.get("/{order_id}/{product_id}", response_model=OrderProductSchema)
 async def get_order_product(
     order_id: int,
     product_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
-    return await crud.get_order_product(
-        order_id=order_id, product_id=product_id, session=session
+    return await crud.order_product_repository.get(
+        session=session, ident=(order_id, product_id)
     )
 
 
@@ -53,15 +57,10 @@ async def update_order_product(
     order_id: int,
     product_id: int,
     order_product_update: OrderProductUpdateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    order_product = await crud.get_order_product(
-        order_id=order_id, product_id=product_id, session=session
-    )
-    return await crud.update_profile(
-        session=session,
-        order_product_update=order_product_update,
-        order_product=order_product,
+    return await crud.order_product_repository.update(
+        session=session, ident=(order_id, product_id), data=order_product_update
     )
 
 
@@ -69,9 +68,8 @@ async def update_order_product(
 async def delete_order_product(
     order_id: int,
     product_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    order_product = await crud.get_order_product(
-        order_id=order_id, product_id=product_id, session=session
+    await crud.order_product_repository.delete(
+        session=session, ident=(order_id, product_id)
     )
-    await crud.delete_order_product(session=session, order_product=order_product)
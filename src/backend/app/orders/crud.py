@@ -1,93 +1,101 @@
+from datetime import datetime
+
 from fastapi import HTTPException
 from fastapi import status
-from sqlalchemy.engine import Result
+from sqlalchemy import delete
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
+from src.backend.app.core.models import Cart
+from src.backend.app.core.models import CartItem
+from src.backend.app.core.models import Coupon
 from src.backend.app.core.models import Order
-from src.backend.app.orders.schemas import OrderCreateSchema
-from src.backend.app.orders.schemas import OrderUpdateSchema
+from src.backend.app.core.models import OrderProduct
+from src.backend.app.core.repository import AsyncRepository
+from src.backend.app.core.repository import database_error
+from src.backend.app.products.crud import reserve_stock
+
+order_repository = AsyncRepository(Order)
 
 
-async def create_order(
+async def checkout(
     session: AsyncSession,
-    order: OrderCreateSchema,
-) -> Order:
-    """Create new order"""
-    new_order = Order(
-        user_id=order.user_id,
-    )
+    cart_id: int,
+    current_user: UserAuthSchema,
+    coupon_code: str | None = None,
+) -> dict:
+    """Lock the cart, move its items into a new order and reserve the stock"""
     try:
-        session.add(new_order)
-        await session.commit()
-        await session.refresh(new_order)
-        return new_order
+        user_id = await session.scalar(
+            select(Cart.user_id).where(Cart.id == cart_id).with_for_update()
+        )
     except SQLAlchemyError:
-        await session.rollback()
+        raise database_error()
+    if user_id is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error",
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Cart {cart_id} not found"
         )
-
-
-async def get_order(order_id: int, session: AsyncSession) -> Order | None:
-    """Get order by id"""
-    try:
-        statement = select(Order).where(Order.id == order_id)
-        order: Order | None = await session.scalar(statement=statement)
-        if not order:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Order {order_id} not found",
-            )
-        return order
-    except SQLAlchemyError:
+    if user_id != current_user.id and not (
+        current_user.is_admin or current_user.is_super_admin
+    ):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: not your cart",
         )
 
-
-async def get_orders(session: AsyncSession) -> list[Order]:
-    """Get all orders"""
     try:
-        statement = select(Order)
-        result: Result = await session.execute(statement=statement)
-        orders = result.scalars().all()
-        return list(orders)
+        result = await session.execute(
+            delete(CartItem)
+            .where(CartItem.cart_id == cart_id)
+            .returning(CartItem.product_id, CartItem.quantity)
+        )
+        items = {}
+        for product_id, quantity in result.all():
+            items[product_id] = items.get(product_id, 0) + quantity
+        coupon_id = None
+        if coupon_code is not None:
+            now = datetime.utcnow()
+            coupon_id = await session.scalar(
+                select(Coupon.id).where(
+                    Coupon.code == coupon_code,
+                    Coupon.active,
+                    Coupon.valid_from <= now,
+                    Coupon.valid_until >= now,
+                )
+            )
     except SQLAlchemyError:
+        raise database_error()
+    if not items:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cart {cart_id} is empty"
         )
-
-
-async def update_order(
-    session: AsyncSession,
-    order: Order,
-    order_update: OrderUpdateSchema,
-) -> Order:
-    """Update order"""
-    try:
-        for name, value in order_update.model_dump(exclude_unset=True).items():
-            setattr(order, name, value)
-        await session.commit()
-        await session.refresh(order)
-        return order
-    except SQLAlchemyError:
-        await session.rollback()
+    if coupon_code is not None and coupon_id is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Coupon {coupon_code} is not valid",
         )
 
-
-async def delete_order(session: AsyncSession, order: Order) -> None:
-    """Delete order"""
+    stock = await reserve_stock(session=session, items=items)
     try:
-        await session.delete(order)
-        await session.commit()
-        return None
-    except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+        order_id = await session.scalar(
+            insert(Order)
+            .values(user_id=user_id, coupon_id=coupon_id)
+            .returning(Order.id)
         )
+        products = [
+            {"order_id": order_id, "product_id": product_id, "quantity": quantity}
+            for product_id, quantity in sorted(items.items())
+        ]
+        await session.execute(insert(OrderProduct).values(products))
+    except SQLAlchemyError:
+        raise database_error()
+    return {
+        "id": order_id,
+        "user_id": user_id,
+        "coupon_id": coupon_id,
+        "products": products,
+        "stock": stock,
+    }
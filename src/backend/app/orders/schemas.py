@@ -1,5 +1,8 @@
 from pydantic import BaseModel
 
+from src.backend.app.order_products.schemas import OrderProductSchema
+from src.backend.app.products.schemas import ProductStockSchema
+
 
 class OrderBaseSchema(BaseModel):
     user_id: int
@@ -16,3 +19,13 @@ class OrderUpdateSchema(BaseModel):
 class OrderSchema(OrderBaseSchema):
     id: int
     coupon_id: int | None = None
+
+
+class OrderCheckoutSchema(BaseModel):
+    cart_id: int
+    coupon_code: str | None = None
+
+
+class OrderCheckoutResultSchema(OrderSchema):
+    products: list[OrderProductSchema]
+    stock: list[ProductStockSchema]
@@ -1,15 +1,24 @@
 from fastapi import APIRouter
+from fastapi import BackgroundTasks
 from fastapi import Depends
+from fastapi import Query
 from fastapi import status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.auth.utils import admin_required
-from src.backend.app.auth.utils import get_current_user_name
+from src.backend.app.auth.utils import get_current_user
 from src.backend.app.core.models import db_helper
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import PageSchema
+from src.backend.app.core.streaming import STREAM_DESCRIPTION
 from src.backend.app.orders import crud
+from src.backend.app.orders.schemas import OrderCheckoutResultSchema
+from src.backend.app.orders.schemas import OrderCheckoutSchema
 from src.backend.app.orders.schemas import OrderCreateSchema
 from src.backend.app.orders.schemas import OrderSchema
 from src.backend.app.orders.schemas import OrderUpdateSchema
+from src.backend.app.products.autocomplete import product_name_index
 
 router = APIRouter(tags=["Order"])
 
@@ -17,46 +26,71 @@ router = APIRouter(tags=["Order"])
 @router.post("/", response_model=OrderSchema, status_code=status.HTTP_201_CREATED)
 async def create_order(
     order_in: OrderCreateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    return await crud.create_order(session=session, order=order_in)
+    return await crud.order_repository.create(session=session, data=order_in)
 
 
-@router.get("/", response_model=list[OrderSchema])
+@router.post(
+    "/checkout",
+    response_model=OrderCheckoutResultSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def checkout(
+    checkout_in: OrderCheckoutSchema,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
+):
+    order = await crud.checkout(
+        session=session,
+        cart_id=checkout_in.cart_id,
+        current_user=current_user,
+        coupon_code=checkout_in.coupon_code,
+    )
+    for product in order["stock"]:
+        if not product["available"]:
+            background_tasks.add_task(product_name_index.remove, product["id"])
+    return order
+
+
+@router.get("/", response_model=PageSchema[OrderSchema])
 async def get_orders(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    page: PageParams = Depends(),
+    stream: bool = Query(default=False, description=STREAM_DESCRIPTION),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.get_orders(session=session)
+    await admin_required(current_user=current_user)
+    if stream:
+        return crud.order_repository.stream(schema=OrderSchema)
+    return await crud.order_repository.get_page(session=session, page=page)
 
 
 @router.get("/{order_id}", response_model=OrderSchema)
 async def get_order(
     order_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
-    return await crud.get_order(order_id=order_id, session=session)
+    return await crud.order_repository.get(session=session, ident=order_id)
 
 
 @router.patch("/{order_id}", response_model=OrderSchema)
 async def update_order(
     order_id: int,
     order_update: OrderUpdateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    order = await crud.get_order(order_id=order_id, session=session)
-    return await crud.update_order(
-        session=session, order=order, order_update=order_update
+    return await crud.order_repository.update(
+        session=session, ident=order_id, data=order_update
     )
 
 
 @router.delete("/{order_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_order(
     order_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    order = await crud.get_order(order_id=order_id, session=session)
-    await crud.delete_order(session=session, order=order)
+    await admin_required(current_user=current_user)
+    await crud.order_repository.delete(session=session, ident=order_id)
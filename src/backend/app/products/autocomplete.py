@@ -0,0 +1,92 @@
+import asyncio
+import bisect
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select
+
+from src.backend.app.core.models import db_helper
+from src.backend.app.core.models import Product
+
+logger = logging.getLogger(__name__)
+
+
+class ProductNameIndex:
+    """Sorted in-memory index of available product names for autocomplete.
+
+    Entries are ``(casefolded name, id, name)`` tuples kept in order, so a
+    prefix lookup is one bisect followed by a scan of the matches. The
+    index is built at startup and patched by the product write endpoints
+    of this worker process. It is also rebuilt from the database every
+    ``autocomplete_reload_seconds``, which is how changes made through
+    other workers reach it.
+    """
+
+    def __init__(self):
+        self._entries: list[tuple[str, int, str]] = []
+        self._by_id: dict[int, tuple[str, int, str]] = {}
+        self._reload_task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def load(self) -> None:
+        async with db_helper.session_factory() as session:
+            result = await session.execute(
+                select(Product.id, Product.name).where(Product.available)
+            )
+            rows = result.all()
+        self._by_id = {
+            product_id: (name.casefold(), product_id, name) for product_id, name in rows
+        }
+        self._entries = sorted(self._by_id.values())
+
+    async def reload(self) -> None:
+        """Rebuild the index, keeping the current one if the database fails"""
+        try:
+            await self.load()
+        except (SQLAlchemyError, OSError) as e:
+            logger.error("Autocomplete reload failed, keeping index: %s", e)
+
+    async def _reload_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.reload()
+
+    def start_auto_reload(self, interval: float) -> None:
+        if interval > 0:
+            self._reload_task = asyncio.get_running_loop().create_task(
+                self._reload_periodically(interval)
+            )
+
+    def stop_auto_reload(self) -> None:
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            self._reload_task = None
+
+    def remove(self, product_id: int) -> None:
+        entry = self._by_id.pop(product_id, None)
+        if entry is not None:
+            del self._entries[bisect.bisect_left(self._entries, entry)]
+
+    def put(self, product_id: int, name: str, available: bool = True) -> None:
+        """Add, rename or drop a product after it was written"""
+        self.remove(product_id)
+        if available:
+            entry = (name.casefold(), product_id, name)
+            bisect.insort(self._entries, entry)
+            self._by_id[product_id] = entry
+
+    def complete(self, prefix: str, limit: int) -> list[dict]:
+        """Up to ``limit`` products whose name starts with ``prefix``"""
+        prefix = prefix.casefold()
+        start = bisect.bisect_left(self._entries, (prefix,))
+        suggestions = []
+        for key, product_id, name in self._entries[start : start + limit]:
+            if not key.startswith(prefix):
+                break
+            suggestions.append({"id": product_id, "name": name})
+        return suggestions
+
+
+product_name_index = ProductNameIndex()
@@ -1,97 +1,135 @@
 from fastapi import HTTPException
 from fastapi import status
-from sqlalchemy.engine import Result
+from sqlalchemy import any_
+from sqlalchemy import bindparam
+from sqlalchemy import Float
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.backend.app.core.models import Product
-from src.backend.app.products.schemas import ProductCreateSchema
-from src.backend.app.products.schemas import ProductUpdateSchema
+from src.backend.app.core.models.product import SEARCH_CONFIG
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import paginate
+from src.backend.app.core.repository import AsyncRepository
+from src.backend.app.core.repository import database_error
+from src.backend.app.products.schemas import ProductSchema
+from src.backend.app.products.schemas import ProductSort
 
+product_repository = AsyncRepository(Product)
 
-async def create_product(
-    session: AsyncSession,
-    product: ProductCreateSchema,
-) -> Product:
-    """Create new product"""
-    new_product = Product(
-        name=product.name,
-        description=product.description,
-        price=product.price,
-        quantity=product.quantity,
-        category_id=product.category_id,
-    )
-    try:
-        session.add(new_product)
-        await session.commit()
-        await session.refresh(new_product)
-        return new_product
-    except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error",
-        )
+PRODUCT_SORT_KEYS = {
+    ProductSort.ID: (Product.id,),
+    ProductSort.PRICE: (Product.price, Product.id),
+    ProductSort.PRICE_DESC: (Product.price.desc(), Product.id.desc()),
+}
 
 
-async def get_product(product_id: int, session: AsyncSession) -> Product | None:
-    """Get product by id"""
+async def get_products(
+    session: AsyncSession,
+    page: PageParams,
+    min_price: int | None = None,
+    max_price: int | None = None,
+    category_id: int | None = None,
+    available: bool | None = None,
+    sort: ProductSort = ProductSort.ID,
+) -> dict:
+    """Get one page of products matching the filters"""
+    statement = select(*product_repository.columns(ProductSchema))
+    if min_price is not None:
+        statement = statement.where(Product.price >= min_price)
+    if max_price is not None:
+        statement = statement.where(Product.price <= max_price)
+    if category_id is not None:
+        statement = statement.where(Product.category_id == category_id)
+    if available is not None:
+        statement = statement.where(Product.available == available)
     try:
-        statement = select(Product).where(Product.id == product_id)
-        product: Product | None = await session.scalar(statement=statement)
-        if not product:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Product {product_id} not found",
-            )
-        return product
-    except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+        return await paginate(
+            session, statement, PRODUCT_SORT_KEYS[sort], page, mappings=True
         )
-
-
-async def get_products(session: AsyncSession) -> list[Product]:
-    """Get all products"""
-    try:
-        statement = select(Product)
-        result: Result = await session.execute(statement=statement)
-        products = result.scalars().all()
-        return list(products)
     except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+        raise database_error()
 
 
-async def update_product(
+async def search_products(
     session: AsyncSession,
-    product: Product,
-    product_update: ProductUpdateSchema,
-) -> Product:
-    """Update product"""
+    page: PageParams,
+    q: str,
+    category_id: int | None = None,
+    available: bool | None = None,
+) -> dict:
+    """Full-text search over name and description, best matches first"""
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Product.search_vector, query, type_=Float).label("rank")
+    statement = select(*product_repository.columns(ProductSchema), rank).where(
+        Product.search_vector.op("@@")(query)
+    )
+    if category_id is not None:
+        statement = statement.where(Product.category_id == category_id)
+    if available is not None:
+        statement = statement.where(Product.available == available)
     try:
-        for name, value in product_update.model_dump(exclude_unset=True).items():
-            setattr(product, name, value)
-        await session.commit()
-        await session.refresh(product)
-        return product
-    except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+        return await paginate(
+            session, statement, (rank.desc(), Product.id), page, mappings=True
         )
+    except SQLAlchemyError:
+        raise database_error()
 
 
-async def delete_product(session: AsyncSession, product: Product) -> None:
-    """Delete product"""
+async def get_products_by_ids(session: AsyncSession, ids: list[int]) -> dict:
+    """Get products in the order of ids and list the ids that do not exist"""
+    ids = list(dict.fromkeys(ids))
+    statement = select(*product_repository.columns(ProductSchema)).where(
+        Product.id == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+    )
     try:
-        await session.delete(product)
-        await session.commit()
-        return None
+        result = await session.execute(statement)
     except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+        raise database_error()
+    found = {row["id"]: dict(row) for row in result.mappings()}
+    return {
+        "items": [found[product_id] for product_id in ids if product_id in found],
+        "missing": [product_id for product_id in ids if product_id not in found],
+    }
+
+
+async def reserve_stock(session: AsyncSession, items: dict[int, int]) -> list[dict]:
+    """Take the quantities out of stock in id order, 409 on any shortage"""
+    reserved = []
+    for product_id, quantity in sorted(items.items()):
+        statement = (
+            update(Product)
+            .where(
+                Product.id == product_id,
+                Product.available,
+                Product.quantity >= quantity,
+            )
+            .values(
+                quantity=Product.quantity - quantity,
+                available=Product.quantity > quantity,
+            )
+            .returning(Product.id, Product.quantity, Product.available)
         )
+        try:
+            result = await session.execute(statement)
+            row = result.mappings().one_or_none()
+            if row is None:
+                exists = await session.scalar(
+                    select(Product.id).where(Product.id == product_id)
+                )
+        except SQLAlchemyError:
+            raise database_error()
+        if row is None:
+            if exists is None:
+                raise product_repository.not_found(product_id)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Not enough stock for product {product_id}",
+            )
+        reserved.append(dict(row))
+    return reserved
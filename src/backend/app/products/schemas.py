@@ -1,4 +1,10 @@
+from enum import Enum
+
 from pydantic import BaseModel
+from pydantic import computed_field
+from pydantic import Field
+
+from src.backend.app.core.config import settings
 
 
 class ProductBaseSchema(BaseModel):
@@ -25,3 +31,58 @@ class ProductUpdateSchema(ProductBaseSchema):
 class ProductSchema(ProductBaseSchema):
     id: int
     available: bool
+    review_count: int = 0
+    rating_sum: int = 0
+    one_star_count: int = 0
+    two_star_count: int = 0
+    three_star_count: int = 0
+    four_star_count: int = 0
+    five_star_count: int = 0
+
+    @computed_field
+    @property
+    def average_rating(self) -> float | None:
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 2)
+
+
+class ProductSearchSchema(ProductSchema):
+    rank: float
+
+
+class ProductBatchRequestSchema(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=settings.batch_size_max)
+
+
+class ProductBatchSchema(BaseModel):
+    items: list[ProductSchema]
+    missing: list[int]
+
+
+class StockReservationItemSchema(BaseModel):
+    product_id: int
+    quantity: int = Field(gt=0)
+
+
+class StockReservationSchema(BaseModel):
+    items: list[StockReservationItemSchema] = Field(
+        min_length=1, max_length=settings.batch_size_max
+    )
+
+
+class ProductStockSchema(BaseModel):
+    id: int
+    quantity: int
+    available: bool
+
+
+class ProductSuggestionSchema(BaseModel):
+    id: int
+    name: str
+
+
+class ProductSort(str, Enum):
+    ID = "id"
+    PRICE = "price"
+    PRICE_DESC = "-price"
@@ -1,15 +1,30 @@
 from fastapi import APIRouter
+from fastapi import BackgroundTasks
 from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
 from fastapi import status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.auth.utils import admin_required
-from src.backend.app.auth.utils import get_current_user_name
+from src.backend.app.auth.utils import get_current_user
+from src.backend.app.core.config import settings
 from src.backend.app.core.models import db_helper
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import PageSchema
 from src.backend.app.products import crud
+from src.backend.app.products.autocomplete import product_name_index
+from src.backend.app.products.schemas import ProductBatchRequestSchema
+from src.backend.app.products.schemas import ProductBatchSchema
 from src.backend.app.products.schemas import ProductCreateSchema
 from src.backend.app.products.schemas import ProductSchema
+from src.backend.app.products.schemas import ProductSearchSchema
+from src.backend.app.products.schemas import ProductSort
+from src.backend.app.products.schemas import ProductStockSchema
+from src.backend.app.products.schemas import ProductSuggestionSchema
 from src.backend.app.products.schemas import ProductUpdateSchema
+from src.backend.app.products.schemas import StockReservationSchema
 
 router = APIRouter(tags=["Product"])
 
@@ -21,49 +36,144 @@ router = APIRouter(tags=["Product"])
 )
 async def create_product(
     product_in: ProductCreateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.create_product(session=session, product=product_in)
+    await admin_required(current_user=current_user)
+    product = await crud.product_repository.create(session=session, data=product_in)
+    # background tasks only run once the transaction has been committed
+    background_tasks.add_task(
+        product_name_index.put, product.id, product.name, product.available
+    )
+    return product
 
 
-@router.get("/", response_model=list[ProductSchema])
+@router.get("/", response_model=PageSchema[ProductSchema])
 async def get_products(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    min_price: int | None = Query(default=None, ge=0),
+    max_price: int | None = Query(default=None, ge=0),
+    category_id: int | None = None,
+    available: bool | None = None,
+    sort: ProductSort = ProductSort.ID,
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    return await crud.get_products(
+        session=session,
+        page=page,
+        min_price=min_price,
+        max_price=max_price,
+        category_id=category_id,
+        available=available,
+        sort=sort,
+    )
+
+
+@router.get("/search", response_model=PageSchema[ProductSearchSchema])
+async def search_products(
+    q: str = Query(min_length=1, max_length=200),
+    category_id: int | None = None,
+    available: bool | None = None,
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
 ):
-    return await crud.get_products(session=session)
+    return await crud.search_products(
+        session=session,
+        page=page,
+        q=q,
+        category_id=category_id,
+        available=available,
+    )
+
+
+@router.post("/reserve", response_model=list[ProductStockSchema])
+async def reserve_stock(
+    reservation: StockReservationSchema,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
+):
+    await admin_required(current_user=current_user)
+    items = {}
+    for item in reservation.items:
+        items[item.product_id] = items.get(item.product_id, 0) + item.quantity
+    products = await crud.reserve_stock(session=session, items=items)
+    for product in products:
+        if not product["available"]:
+            background_tasks.add_task(product_name_index.remove, product["id"])
+    return products
+
+
+@router.get("/autocomplete", response_model=list[ProductSuggestionSchema])
+async def autocomplete_products(
+    prefix: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    return product_name_index.complete(prefix=prefix, limit=limit)
+
+
+@router.get("/batch", response_model=ProductBatchSchema)
+async def get_products_batch(
+    ids: str = Query(description="Comma separated product ids"),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    try:
+        product_ids = [int(product_id) for product_id in ids.split(",")]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid ids"
+        )
+    if len(product_ids) > settings.batch_size_max:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.batch_size_max} ids per request",
+        )
+    return await crud.get_products_by_ids(session=session, ids=product_ids)
+
+
+@router.post("/batch", response_model=ProductBatchSchema)
+async def post_products_batch(
+    batch: ProductBatchRequestSchema,
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    return await crud.get_products_by_ids(session=session, ids=batch.ids)
 
 
 @router.get("/{product_id}", response_model=ProductSchema)
 async def get_product(
     product_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
 ):
-    return await crud.get_product(product_id=product_id, session=session)
+    return await crud.product_repository.get(session=session, ident=product_id)
 
 
 @router.patch("/{product_id}", response_model=ProductSchema)
 async def update_product(
     product_id: int,
     product_update: ProductUpdateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    product = await crud.get_product(product_id=product_id, session=session)
-    return await crud.update_product(
-        session=session, product=product, product_update=product_update
+    await admin_required(current_user=current_user)
+    product = await crud.product_repository.update(
+        session=session, ident=product_id, data=product_update
+    )
+    background_tasks.add_task(
+        product_name_index.put, product.id, product.name, product.available
     )
+    return product
 
 
 @router.delete("/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_product(
     product_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    product = await crud.get_product(product_id=product_id, session=session)
-    await crud.delete_product(session=session, product=product)
+    await admin_required(current_user=current_user)
+    await crud.product_repository.delete(session=session, ident=product_id)
+    background_tasks.add_task(product_name_index.remove, product_id)
     return None
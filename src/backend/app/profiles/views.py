@@ -3,9 +3,12 @@ from fastapi import Depends
 from fastapi import status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.auth.utils import admin_required
-from src.backend.app.auth.utils import get_current_user_name
+from src.backend.app.auth.utils import get_current_user
 from src.backend.app.core.models import db_helper
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import PageSchema
 from src.backend.app.profiles import crud
 from src.backend.app.profiles.schemas import ProfileCreateSchema
 from src.backend.app.profiles.schemas import ProfileSchema
@@ -21,51 +24,50 @@ router = APIRouter(tags=["Profile"])
 )
 async def create_profile(
     profile_in: ProfileCreateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    return await crud.create_profile(session=session, profile=profile_in)
+    return await crud.profile_repository.create(session=session, data=profile_in)
 
 
-@router.get("/", response_model=list[ProfileSchema])
+@router.get("/", response_model=PageSchema[ProfileSchema])
 async def get_profiles(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.get_profiles(session=session)
+    await admin_required(current_user=current_user)
+    return await crud.profile_repository.get_page(session=session, page=page)
 
 
 @router.get("/{profile_id}", response_model=ProfileSchema)
 async def get_profile(
     profile_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.get_profile(profile_id=profile_id, session=session)
+    await admin_required(current_user=current_user)
+    return await crud.profile_repository.get(session=session, ident=profile_id)
 
 
 @router.patch("/{profile_id}", response_model=ProfileSchema)
 async def update_profile(
     profile_id: int,
     profile_update: ProfileUpdateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    profile = await crud.get_profile(profile_id=profile_id, session=session)
-    return await crud.update_profile(
-        session=session, profile=profile, profile_update=profile_update
+    await admin_required(current_user=current_user)
+    return await crud.profile_repository.update(
+        session=session, ident=profile_id, data=profile_update
     )
 
 
 @router.delete("/{profile_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_profile(
     profile_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    profile = await crud.get_profile(profile_id=profile_id, session=session)
-    await crud.delete_profile(session=session, profile=profile)
+    await admin_required(current_user=current_user)
+    await crud.profile_repository.delete(session=session, ident=profile_id)
     return None
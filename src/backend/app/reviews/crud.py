@@ -1,110 +1,102 @@
-from fastapi import HTTPException
-from fastapi import status
-from sqlalchemy.engine import Result
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.core.models import Product
 from src.backend.app.core.models import Review
+from src.backend.app.core.models.review import Rating
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.repository import AsyncRepository
+from src.backend.app.core.repository import database_error
 from src.backend.app.reviews.schemas import ReviewCreateSchema
+from src.backend.app.reviews.schemas import ReviewSchema
 from src.backend.app.reviews.schemas import ReviewUpdateSchema
 
+review_repository = AsyncRepository(Review)
 
-async def create_review(
-    session: AsyncSession,
-    review: ReviewCreateSchema,
-) -> Review:
-    """Create new review"""
-    new_review = Review(
-        product_id=review.product_id,
-        review_text=review.review_text,
-        rating=review.rating,
-    )
-    try:
-        session.add(new_review)
-        await session.commit()
-        await session.refresh(new_review)
-        return new_review
-    except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error",
-        )
+RATING_COUNT_COLUMNS = {
+    Rating.ONE: Product.one_star_count,
+    Rating.TWO: Product.two_star_count,
+    Rating.THREE: Product.three_star_count,
+    Rating.FOUR: Product.four_star_count,
+    Rating.FIVE: Product.five_star_count,
+}
 
 
-async def get_review(review_id: int, session: AsyncSession) -> Review | None:
-    """Get review"""
-    try:
-        statement = select(Review).where(Review.id == review_id)
-        review: Review | None = await session.scalar(statement=statement)
-        if not review:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Review {review_id} not found",
-            )
-        return review
-    except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+async def get_reviews_by_product(
+    product_id: int, page: PageParams, session: AsyncSession
+) -> dict:
+    """Get all reviews of the product"""
+    return await review_repository.get_page(
+        session, page, Review.product_id == product_id, schema=ReviewSchema
+    )
 
 
-async def get_reviews(session: AsyncSession) -> list[Review]:
-    """Get all reviews"""
+async def update_rating_totals(
+    session: AsyncSession,
+    product_id: int,
+    removed: Rating | None = None,
+    added: Rating | None = None,
+) -> None:
+    """Move the product's review totals from removed to added in one UPDATE"""
+    values = {}
+    counts = {}
+    if removed is not None:
+        counts[removed] = counts.get(removed, 0) - 1
+    if added is not None:
+        counts[added] = counts.get(added, 0) + 1
+    for rating, delta in counts.items():
+        if delta:
+            column = RATING_COUNT_COLUMNS[rating]
+            values[column.key] = column + delta
+    review_delta = (added is not None) - (removed is not None)
+    if review_delta:
+        values["review_count"] = Product.review_count + review_delta
+    stars_delta = (added.stars if added else 0) - (removed.stars if removed else 0)
+    if stars_delta:
+        values["rating_sum"] = Product.rating_sum + stars_delta
+    if not values:
+        return
     try:
-        statement = select(Review)
-        result: Result = await session.execute(statement=statement)
-        reviews = result.scalars().all()
-        return list(reviews)
-    except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
+        await session.execute(
+            update(Product).where(Product.id == product_id).values(**values)
         )
+    except SQLAlchemyError:
+        raise database_error()
 
 
-async def get_reviews_by_product(
-    product_id: int, session: AsyncSession
-) -> list[Review]:
-    """Get all reviews"""
-    try:
-        statement = select(Review).where(Review.product_id == product_id)
-        result: Result = await session.execute(statement=statement)
-        reviews = result.scalars().all()
-        return list(reviews)
-    except SQLAlchemyError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+async def create_review(session: AsyncSession, data: ReviewCreateSchema) -> Review:
+    """Insert the review and count it in the product's totals"""
+    review = await review_repository.create(session=session, data=data)
+    await update_rating_totals(session, review.product_id, added=review.rating)
+    return review
 
 
 async def update_review(
-    session: AsyncSession,
-    review: Review,
-    review_update: ReviewUpdateSchema,
+    session: AsyncSession, review_id: int, data: ReviewUpdateSchema
 ) -> Review:
-    """Update review"""
+    """Patch the review and move its rating in the product's totals"""
+    if data.rating is None:
+        return await review_repository.update(
+            session=session, ident=review_id, data=data
+        )
     try:
-        for name, value in review_update.model_dump(exclude_unset=True).items():
-            setattr(review, name, value)
-        await session.commit()
-        await session.refresh(review)
-        return review
+        # lock the row so a concurrent update cannot change the old rating
+        review = await session.get(Review, review_id, with_for_update=True)
     except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+        raise database_error()
+    if review is None:
+        raise review_repository.not_found(review_id)
+    old_rating = review.rating
+    review = await review_repository.update(session=session, ident=review_id, data=data)
+    await update_rating_totals(
+        session, review.product_id, removed=old_rating, added=review.rating
+    )
+    return review
 
 
-async def delete_review(session: AsyncSession, review: Review) -> None:
-    """Delete review"""
-    try:
-        await session.delete(review)
-        await session.commit()
-        return None
-    except SQLAlchemyError:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
-        )
+async def delete_review(session: AsyncSession, review_id: int) -> Review:
+    """Delete the review and take it out of the product's totals"""
+    review = await review_repository.delete(session=session, ident=review_id)
+    await update_rating_totals(session, review.product_id, removed=review.rating)
+    return review
@@ -1,11 +1,16 @@
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Query
 from fastapi import status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.auth.utils import admin_required
-from src.backend.app.auth.utils import get_current_user_name
+from src.backend.app.auth.utils import get_current_user
 from src.backend.app.core.models import db_helper
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import PageSchema
+from src.backend.app.core.streaming import STREAM_DESCRIPTION
 from src.backend.app.reviews import crud
 from src.backend.app.reviews.schemas import ReviewCreateSchema
 from src.backend.app.reviews.schemas import ReviewSchema
@@ -21,55 +26,60 @@ router = APIRouter(tags=["Review"])
 )
 async def create_review(
     review_in: ReviewCreateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    return await crud.create_review(session=session, review=review_in)
+    return await crud.create_review(session=session, data=review_in)
 
 
-@router.get("/", response_model=list[ReviewSchema])
+@router.get("/", response_model=PageSchema[ReviewSchema])
 async def get_reviews(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    page: PageParams = Depends(),
+    stream: bool = Query(default=False, description=STREAM_DESCRIPTION),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.get_reviews(session=session)
+    await admin_required(current_user=current_user)
+    if stream:
+        return crud.review_repository.stream(schema=ReviewSchema)
+    return await crud.review_repository.get_page(session=session, page=page)
 
 
-@router.get("/product/{product_id}", response_model=list[ReviewSchema])
+@router.get("/product/{product_id}", response_model=PageSchema[ReviewSchema])
 async def get_reviews_by_product(
     product_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    page: PageParams = Depends(),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
 ):
-    return await crud.get_reviews_by_product(product_id=product_id, session=session)
+    return await crud.get_reviews_by_product(
+        product_id=product_id, page=page, session=session
+    )
 
 
 @router.get("/{review_id}", response_model=ReviewSchema)
 async def get_review(
     review_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
-    return await crud.get_review(review_id=review_id, session=session)
+    return await crud.review_repository.get(session=session, ident=review_id)
 
 
 @router.patch("/{review_id}", response_model=ReviewSchema)
 async def update_review(
     review_id: int,
     review_update: ReviewUpdateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
-    review = await crud.get_review(review_id=review_id, session=session)
     return await crud.update_review(
-        session=session, review=review, review_update=review_update
+        session=session, review_id=review_id, data=review_update
     )
 
 
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_review(
     review_id: int,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    review = await crud.get_review(review_id=review_id, session=session)
-    await crud.delete_review(session=session, review=review)
+    await admin_required(current_user=current_user)
+    await crud.delete_review(session=session, review_id=review_id)
     return None
@@ -5,29 +5,38 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..auth.cache import user_cache
+from ..auth.revocation import token_revocation_list
 from ..auth.utils import get_password_hash
 from ..auth.utils import get_user_by_username
 from ..core.config import settings
+from ..core.models import db_helper
 from ..core.models import User
 from ..core.models.user import Role
+from ..core.pagination import PageParams
+from ..core.pagination import paginate
 from .schemas import UserCreateSchema
 from .schemas import UserUpdateSchema
 
 
+def forget_user(user_id: int, *usernames: str) -> None:
+    """Drop the cached auth data and revoke the access tokens of the user"""
+    user_cache.invalidate(*usernames)
+    token_revocation_list.revoke_user(user_id)
+
+
 async def create_user(session: AsyncSession, user: UserCreateSchema) -> User:
     """Create User"""
     new_user = User(
         username=user.username,
         email=user.email,
-        hashed_password=get_password_hash(user.password),
+        hashed_password=await get_password_hash(user.password),
     )
     try:
         session.add(new_user)
-        await session.commit()
-        await session.refresh(new_user)
+        await session.flush()
         return new_user
     except SQLAlchemyError:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User with that username or email already exists!",
@@ -54,20 +63,20 @@ async def create_super_admin(session: AsyncSession) -> User | None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Super admin already exists!"
         )
+    # release the connection while the password is hashed
+    await session.commit()
 
     super_admin = User(
         username="superadmin",
         email="superadmin@example.com",
-        hashed_password=get_password_hash(settings.SUPER_ADMIN_PASSWORD),
+        hashed_password=await get_password_hash(settings.SUPER_ADMIN_PASSWORD),
         role=Role.SUPER_ADMIN,
     )
     try:
         session.add(super_admin)
-        await session.commit()
-        await session.refresh(super_admin)
+        await session.flush()
         return super_admin
     except SQLAlchemyError:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Creating a super admin is not possible!!",
@@ -85,26 +94,22 @@ async def change_admin_rights(
             if user.role == target_role:
                 return user
             user.role = target_role
-            await session.commit()
-            await session.refresh(user)
+            await session.flush()
+            db_helper.after_commit(session, forget_user, user.id, username)
             return user
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"User {username} not found"
         )
     except SQLAlchemyError as e:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
 
 
-async def get_users(session: AsyncSession) -> list[User]:
-    """Get all users"""
+async def get_users(session: AsyncSession, page: PageParams) -> dict:
+    """Get one page of users"""
     try:
-        statement = select(User).order_by(User.id)
-        result: Result = await session.execute(statement=statement)
-        users = result.scalars().all()
-        return list(users)
+        return await paginate(session, select(User), (User.id,), page)
     except SQLAlchemyError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
@@ -137,14 +142,16 @@ async def update_user(
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="FORBIDDEN!!!"
         )
+    old_username = user.username
     try:
         for name, value in user_update.model_dump(exclude_unset=True).items():
             setattr(user, name, value)
-        await session.commit()
-        await session.refresh(user)
+        await session.flush()
+        db_helper.after_commit(
+            session, forget_user, user.id, old_username, user.username
+        )
         return user
     except SQLAlchemyError as e:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
@@ -158,9 +165,9 @@ async def delete_user(session: AsyncSession, user: User) -> None:
         )
     try:
         await session.delete(user)
-        await session.commit()
+        await session.flush()
+        db_helper.after_commit(session, forget_user, user.id, user.username)
     except SQLAlchemyError as e:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
@@ -179,14 +186,13 @@ async def change_user_activity(
                     status_code=status.HTTP_403_FORBIDDEN, detail="FORBIDDEN!!!"
                 )
             user.is_active = False if user.is_active else True
-            await session.commit()
-            await session.refresh(user)
+            await session.flush()
+            db_helper.after_commit(session, forget_user, user.id, username)
             return user
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"User {username} not found"
         )
     except SQLAlchemyError as e:
-        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         )
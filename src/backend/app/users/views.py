@@ -1,18 +1,25 @@
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Query
 from fastapi import status
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.backend.app.auth.schemas import UserAuthSchema
 from src.backend.app.auth.utils import admin_required
-from src.backend.app.auth.utils import get_current_user_name
+from src.backend.app.auth.utils import get_current_user
 from src.backend.app.auth.utils import super_admin_required
 from src.backend.app.core.models import db_helper
+from src.backend.app.core.models import User
+from src.backend.app.core.pagination import PageParams
+from src.backend.app.core.pagination import PageSchema
+from src.backend.app.core.streaming import ndjson_response
+from src.backend.app.core.streaming import STREAM_DESCRIPTION
 from src.backend.app.users import crud
 from src.backend.app.users.schemas import UserCreateSchema
 from src.backend.app.users.schemas import UserSchema
 from src.backend.app.users.schemas import UserUpdateSchema
 
-
 router = APIRouter(tags=["User"])
 
 
@@ -22,7 +29,7 @@ router = APIRouter(tags=["User"])
     status_code=status.HTTP_201_CREATED,
 )
 async def create_super_admin(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
     return await crud.create_super_admin(session=session)
 
@@ -34,10 +41,10 @@ async def create_super_admin(
 )
 async def activate_admin(
     username: str,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await super_admin_required(session=session, current_user_name=current_user_name)
+    await super_admin_required(current_user=current_user)
     return await crud.change_admin_rights(
         session=session, username=username, make_admin=True
     )
@@ -50,10 +57,10 @@ async def activate_admin(
 )
 async def deactivate_admin(
     username: str,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await super_admin_required(session=session, current_user_name=current_user_name)
+    await super_admin_required(current_user=current_user)
     return await crud.change_admin_rights(
         session=session,
         username=username,
@@ -68,27 +75,31 @@ async def deactivate_admin(
 )
 async def create_user(
     user_in: UserCreateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
 ):
     return await crud.create_user(session=session, user=user_in)
 
 
-@router.get("/", response_model=list[UserSchema])
+@router.get("/", response_model=PageSchema[UserSchema])
 async def get_users(
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    page: PageParams = Depends(),
+    stream: bool = Query(default=False, description=STREAM_DESCRIPTION),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
-    return await crud.get_users(session=session)
+    await admin_required(current_user=current_user)
+    if stream:
+        return ndjson_response(select(User).order_by(User.id), UserSchema)
+    return await crud.get_users(session=session, page=page)
 
 
 @router.get("/{username}", response_model=UserSchema)
 async def get_user(
     username: str,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
+    await admin_required(current_user=current_user)
     user = await crud.get_user_by_username(session=session, username=username)
     return user
 
@@ -97,10 +108,10 @@ async def get_user(
 async def update_user(
     username: str,
     user_update: UserUpdateSchema,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
+    await admin_required(current_user=current_user)
     user = await crud.get_user_by_username(session=session, username=username)
     return await crud.update_user(
         session=session,
@@ -112,10 +123,10 @@ async def update_user(
 @router.delete("/{username}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     username: str,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await super_admin_required(session=session, current_user_name=current_user_name)
+    await super_admin_required(current_user=current_user)
     user = await crud.get_user_by_username(session=session, username=username)
     await crud.delete_user(session=session, user=user)
     return None
@@ -124,8 +135,8 @@ async def delete_user(
 @router.post("/deactivate_user", response_model=UserSchema)
 async def deactivate_user(
     username: str,
-    session: AsyncSession = Depends(db_helper.scoped_session_dependency),
-    current_user_name: str | None = Depends(get_current_user_name),
+    session: AsyncSession = Depends(db_helper.transaction_dependency),
+    current_user: UserAuthSchema = Depends(get_current_user),
 ):
-    await admin_required(session=session, current_user_name=current_user_name)
+    await admin_required(current_user=current_user)
     return await crud.change_user_activity(session=session, username=username)
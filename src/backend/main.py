@@ -1,20 +1,49 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 
 from src.backend.app.addresses.views import router as address_router
+from src.backend.app.auth.hashing import password_hasher
+from src.backend.app.auth.keys import key_ring
 from src.backend.app.auth.views import router as auth_router
 from src.backend.app.cart_items.views import router as cart_item_router
 from src.backend.app.carts.views import router as cart_router
 from src.backend.app.categories.views import router as category_router
+from src.backend.app.core.config import settings
+from src.backend.app.core.middleware import PrimaryStickyMiddleware
+from src.backend.app.core.models import db_helper
+from src.backend.app.core.responses import FastJSONResponse
 from src.backend.app.coupons.views import router as coupon_router
+from src.backend.app.metrics.views import router as metrics_router
 from src.backend.app.order_products.views import router as order_product_router
 from src.backend.app.orders.views import router as order_router
+from src.backend.app.products.autocomplete import product_name_index
 from src.backend.app.products.views import router as product_router
 from src.backend.app.profiles.views import router as profile_router
 from src.backend.app.reviews.views import router as review_router
 from src.backend.app.users.views import router as user_router
 
-app = FastAPI(title="Fast Store")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    key_ring.start_auto_reload(interval=settings.key_reload_seconds)
+    db_helper.start_replica_monitor(interval=settings.replica_check_seconds)
+    # an empty index is filled in by the next reload if the database is down
+    await product_name_index.reload()
+    product_name_index.start_auto_reload(interval=settings.autocomplete_reload_seconds)
+    yield
+    product_name_index.stop_auto_reload()
+    await db_helper.stop_replica_monitor()
+    key_ring.stop_auto_reload()
+    password_hasher.shutdown()
+
+
+app = FastAPI(
+    title="Fast Store", lifespan=lifespan, default_response_class=FastJSONResponse
+)
+if db_helper.replica_engines:
+    app.add_middleware(PrimaryStickyMiddleware, max_age=settings.replica_sticky_seconds)
 
 
 @app.get("/")
@@ -34,6 +63,7 @@ app.include_router(coupon_router, prefix="/coupon")
 app.include_router(order_router, prefix="/order")
 app.include_router(order_product_router, prefix="/order-product")
 app.include_router(review_router, prefix="/review")
+app.include_router(metrics_router, prefix="/metrics")
 
 
 if __name__ == "__main__":